@@ -1,2 +1,3 @@
 from .mathesar import Mathesar
+from .async_mathesar import AsyncMathesar
 from .classes import *
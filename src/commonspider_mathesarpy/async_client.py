@@ -0,0 +1,213 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from . import deadlines
+from .breaker import Circuit, Circuits, acquire_all, release_all
+from .client import Client, _methods
+from .codec import Codec
+from .exceptions import DeadlineExceeded, raise_for_exception
+from .limits import Limiter
+from .retry import RetryPolicy
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class AsyncClient(Client):
+    def __init__(
+            self,
+            url: str,
+            max_concurrency: int = 100,
+            pool_size: int = 100,
+            pool_size_per_host: int = 0,
+            codec: Codec = None,
+            structs: bool = False,
+            retry: RetryPolicy | bool = True,
+            limits: dict[str, Limiter] = None,
+            circuits: Circuits = None,
+            timeout: deadlines.Timeout = (10.0, 300.0),
+            compress_threshold: int = None
+    ):
+        if aiohttp is None:
+            raise ImportError("AsyncClient requires aiohttp: pip install commonspider_mathesarpy[async]")
+        super().__init__(
+            url,
+            codec=codec,
+            structs=structs,
+            retry=retry,
+            limits=limits,
+            circuits=circuits,
+            timeout=timeout,
+            compress_threshold=compress_threshold
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pool_size = pool_size
+        self._pool_size_per_host = pool_size_per_host
+        self._http: "aiohttp.ClientSession" = None
+
+    def _create_session(self, *args) -> None:
+        # Requests are sent with the aiohttp session of _http_session instead
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    def _http_session(self) -> "aiohttp.ClientSession":
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._pool_size,
+                    limit_per_host=self._pool_size_per_host
+                ),
+                cookie_jar=aiohttp.CookieJar(unsafe=True)
+            )
+        return self._http
+
+    def _csrf(self) -> str:
+        return self._http_session().cookie_jar.filter_cookies(self._url)["csrftoken"].value
+
+    async def login(self, username: str, password: str):
+        login_url = urljoin(self._url, "/auth/login/")
+        http = self._http_session()
+
+        async with http.get(login_url, timeout=self._client_timeout(self._timeout)) as response:
+            dom = BeautifulSoup(await response.text(), "html.parser")
+        token = dom.find("input", {"name": "csrfmiddlewaretoken"})["value"]
+
+        async with http.post(
+            login_url,
+            data={
+                "username": username,
+                "password": password,
+                "csrfmiddlewaretoken": token,
+            },
+            headers={
+                "Referer": login_url
+            },
+            timeout=self._client_timeout(self._timeout)
+        ) as response:
+            response.raise_for_status()
+
+    @property
+    def batch(self):
+        # Not inherited: batches collect the calls of a thread and resolve them synchronously
+        raise AttributeError("AsyncClient does not support batches, send concurrent calls with asyncio.gather")
+
+    async def request(self, method: str, params: dict[str, Any], timeout: deadlines.Timeout = None):
+        data = await self._post(self._message(method, params), timeout)
+        raise_for_exception(data)
+        return self._result(method, data["result"])
+
+    async def _post(self, payload: dict[str, Any] | list[dict[str, Any]], timeout: deadlines.Timeout = None):
+        body, encoding = self._encode(payload)
+        methods = _methods(payload)
+        limiters = self._limiters(methods)
+        circuits = self._circuits_of(methods)
+        if timeout is None:
+            timeout = self._timeout
+        if self._retry_budget is not None:
+            self._retry_budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return await self._limited_send(body, encoding, limiters, circuits, timeout)
+            except DeadlineExceeded:
+                raise
+            except Exception as exc:
+                if self._timed_out(exc) and (left := deadlines.remaining()) is not None and left <= 0:
+                    raise DeadlineExceeded("Deadline exceeded") from exc
+                delay = self._retry_delay(exc, methods, attempt)
+                if delay is None:
+                    raise
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _limited_send(
+            self,
+            body: bytes,
+            encoding: str | None,
+            limiters: list[tuple[Limiter, int]],
+            circuits: list[Circuit],
+            timeout: deadlines.Timeout
+    ):
+        probes = acquire_all(circuits)
+        failed = None
+        acquired = []
+        try:
+            for limiter, count in limiters:
+                if not await limiter.acquire_async(count, deadlines.remaining()):
+                    raise DeadlineExceeded("Deadline exceeded waiting for the request limits")
+                acquired.append(limiter)
+            async with self._connection():
+                # Only the time left after waiting for the limits counts
+                client_timeout = self._client_timeout(timeout)
+                start = time.monotonic()
+                try:
+                    data = await self._send(body, encoding, client_timeout)
+                except Exception:
+                    failed = True
+                    raise
+                finally:
+                    for limiter, _ in limiters:
+                        limiter.release(time.monotonic() - start, bool(failed))
+                    acquired = []
+            failed = False
+            return data
+        finally:
+            for limiter in acquired:
+                limiter.release(None)
+            release_all(circuits, probes, failed)
+
+    @asynccontextmanager
+    async def _connection(self):
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), deadlines.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded("Deadline exceeded waiting for a connection") from None
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    @staticmethod
+    def _client_timeout(timeout: deadlines.Timeout) -> "aiohttp.ClientTimeout":
+        connect, read = deadlines.bounded_timeout(timeout)
+        return aiohttp.ClientTimeout(total=deadlines.remaining(), sock_connect=connect, sock_read=read)
+
+    async def _send(self, body: bytes, encoding: str | None, timeout: "aiohttp.ClientTimeout"):
+        async with self._http_session().post(
+            urljoin(self._url, "/api/rpc/v0/"),
+            headers=self._headers(encoding),
+            data=body,
+            timeout=timeout
+        ) as response:
+            content = await response.read()
+        # aiohttp negotiates and decodes the encodings it supports itself, Content-Length is the size on the wire
+        self.compression_stats.add_response(len(content), response.content_length or len(content))
+        return self._decode(response.status, response.headers.get("Retry-After"), content)
+
+    def _sent(self, error: Exception) -> bool | None:
+        if isinstance(error, aiohttp.ClientConnectorError):
+            return False
+        elif isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError)):
+            return True
+        return None
+
+    def _timed_out(self, error: Exception) -> bool:
+        # Also aiohttp.ServerTimeoutError, a subclass
+        return isinstance(error, asyncio.TimeoutError)
@@ -0,0 +1,383 @@
+from typing import Any, Iterable
+
+from .api import API
+from .async_client import AsyncClient
+from .cache import TTLCache
+from .classes import SearchParam, RecordList, RecordAdded, UserDef, UserInfo, RoleInfo, ConfiguredRoleInfo, \
+    CollaboratorInfo, ColumnInfo
+from .deadlines import Timeout
+from .helpers import Helpers, metadata_kinds, run_async
+from .mathesar import Columns, _schema_methods
+from .metadata import Scan
+
+
+class AsyncAPI(AsyncClient, API):
+    ...
+
+
+class AsyncColumns(Columns):
+    def __init__(self, info: list[ColumnInfo]):
+        self._set_info(info)
+
+    @classmethod
+    async def load(
+            cls,
+            mathesar: AsyncAPI, /,
+            table_oid: int,
+            database_id: int,
+            timeout: Timeout = None
+    ) -> "AsyncColumns":
+        return cls(await mathesar.columns_list(
+            table_oid=table_oid,
+            database_id=database_id,
+            timeout=timeout
+        ))
+
+
+class AsyncMathesar(AsyncAPI, Helpers):
+    """
+    Asynchronous client for the Mathesar API with the convenience wrappers
+    of `Mathesar`, which it shares. The columns of tables are cached for
+    `columns_ttl` seconds; users, roles, configured roles and collaborators
+    are listed on every lookup. It has no `batch`, nor the `_many` helpers,
+    iterators and exports of `Mathesar`, which rely on batches and threads;
+    gather concurrent calls instead.
+    """
+
+    def __init__(self, url: str, /, columns_ttl: float = 60, **kwargs):
+        super().__init__(url, **kwargs)
+        self._columns_cache = TTLCache(ttl=columns_ttl)
+
+    async def request(self, method: str, params: dict[str, Any], timeout: Timeout = None):
+        result = await super().request(method, params, timeout)
+        if method in _schema_methods or method.startswith("data_modeling."):
+            table_oid = None if method.startswith("data_modeling.") else params.get("table_oid")
+            self.invalidate_columns(table_oid=table_oid, database_id=params.get("database_id"))
+        return result
+
+    async def _lookup(self, kind: str, scope: Any = None, timeout: Timeout = None) -> Scan:
+        _, _, id_key, name_key = metadata_kinds[kind]
+        return Scan(await self._list_call(kind, scope)(timeout=timeout), id_key, name_key)
+
+    async def get_columns(
+            self, /,
+            table_oid: int,
+            database_id: int,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> AsyncColumns:
+        """
+        Return the columns of a table, cached per `(database_id, table_oid)`.
+        """
+        columns = self._columns_cache.get((database_id, table_oid))
+        if columns is None:
+            columns = await AsyncColumns.load(self, table_oid=table_oid, database_id=database_id, timeout=timeout)
+            self._columns_cache.set((database_id, table_oid), columns)
+        return columns
+
+    def invalidate_columns(self, /, table_oid: int = None, database_id: int = None, **kwargs):
+        """
+        Drop the cached columns of a table, of a database, or all of them.
+        """
+        self._columns_cache.invalidate(
+            lambda key: (database_id is None or key[0] == database_id)
+                        and (table_oid is None or key[1] == table_oid)
+        )
+
+    async def records_search(
+            self, /,
+            table_oid: int,
+            database_id: int,
+            search_params: list[SearchParam] = (),
+            search_literals: dict[str, str] = None,
+            limit: int = 10,
+            offset: int = 0,
+            return_record_summaries: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> RecordList:
+        return await super().records_search(
+            table_oid=table_oid,
+            database_id=database_id,
+            search_params=await run_async(self._search_params(
+                table_oid,
+                database_id,
+                search_params,
+                search_literals,
+                timeout
+            )),
+            limit=limit,
+            offset=offset,
+            return_record_summaries=return_record_summaries,
+            timeout=timeout
+        )
+
+    async def records_add(
+            self, /,
+            record_def: dict[str | int, Any],
+            table_oid: int,
+            database_id: int,
+            return_record_summaries: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> RecordAdded:
+        return await super().records_add(
+            database_id=database_id,
+            table_oid=table_oid,
+            record_def=await run_async(self._record_def(record_def, table_oid, database_id, timeout)),
+            return_record_summaries=return_record_summaries,
+            timeout=timeout
+        )
+
+    async def records_delete(
+            self, /,
+            table_oid: int,
+            database_id: int,
+            record_ids: Iterable[Any] = (),
+            record_list: RecordList | Iterable[RecordList] | Iterable[dict] = None,
+            id_col: str | int = None,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> list[Any]:
+        record_ids = await run_async(self._record_ids(record_ids, record_list, id_col, table_oid, database_id, timeout))
+        return await super().records_delete(
+            database_id=database_id,
+            table_oid=table_oid,
+            record_ids=list(record_ids),
+            timeout=timeout
+        )
+
+    async def users_get_id(self, /, user_id: int = None, username: str = None, timeout: Timeout = None, **kwargs):
+        return await run_async(self._users_get_id(user_id, username, timeout))
+
+    async def users_get(
+            self, /,
+            user_id: int = None,
+            username: str = None,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> UserInfo:
+        return await run_async(self._users_get(user_id, username, timeout))
+
+    async def users_add(
+            self, /,
+            user_def: UserDef,
+            exists_ok: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> UserInfo:
+        return await run_async(self._users_add(user_def, exists_ok, timeout))
+
+    async def users_delete(
+            self, /,
+            user_id: int = None,
+            username: str = None,
+            missing_ok: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._users_delete(user_id, username, missing_ok, timeout))
+
+    async def collaborators_full_add(
+            self, /,
+            username: str,
+            password: str,
+            database_id: int,
+            is_superuser: bool = False,
+            email: str = None,
+            full_name: str = None,
+            display_language: str = None,
+            rolename: str = None,
+            role_password: str = None,
+            exists_ok: bool = True,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._collaborators_full_add(
+            username,
+            password,
+            database_id,
+            is_superuser,
+            email,
+            full_name,
+            display_language,
+            rolename,
+            role_password,
+            exists_ok,
+            timeout
+        ))
+
+    async def collaborators_full_delete(
+            self, /,
+            username: str,
+            database_id: int,
+            rolename: str = None,
+            missing_ok: bool = True,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._collaborators_full_delete(username, database_id, rolename, missing_ok, timeout))
+
+    async def collaborators_get_id(
+            self, /,
+            collaborator_id: int = None,
+            user_id: int = None,
+            username: str = None,
+            database_id: int = None,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._collaborators_get_id(collaborator_id, user_id, username, database_id, timeout))
+
+    async def collaborators_get(
+            self, /,
+            collaborator_id: int = None,
+            user_id: int = None,
+            username: str = None,
+            database_id: int = None,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> CollaboratorInfo:
+        return await run_async(self._collaborators_get(collaborator_id, user_id, username, database_id, timeout))
+
+    async def collaborators_add(
+            self, /,
+            database_id: int,
+            user_id: int = None,
+            username: str = None,
+            configured_role_id: int = None,
+            rolename: str = None,
+            exists_ok: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> CollaboratorInfo:
+        return await run_async(self._collaborators_add(
+            database_id,
+            user_id,
+            username,
+            configured_role_id,
+            rolename,
+            exists_ok,
+            timeout
+        ))
+
+    async def collaborators_delete(
+            self, /,
+            collaborator_id: int = None,
+            username: str = None,
+            database_id: int = None,
+            missing_ok: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._collaborators_delete(collaborator_id, username, database_id, missing_ok, timeout))
+
+    async def roles_configured_get_id(
+            self, /,
+            configured_role_id: int = None,
+            rolename: str = None,
+            server_id: int = None,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._roles_configured_get_id(configured_role_id, rolename, server_id, timeout))
+
+    async def roles_configured_get(
+            self, /,
+            configured_role_id: int = None,
+            role_name: str = None,
+            server_id: int = None,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._roles_configured_get(configured_role_id, role_name, server_id, timeout))
+
+    async def roles_configured_add(
+            self, /,
+            server_id: int,
+            name: str,
+            password: str,
+            exists_ok: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> ConfiguredRoleInfo:
+        return await run_async(self._roles_configured_add(server_id, name, password, exists_ok, timeout))
+
+    async def roles_configured_delete(
+            self, /,
+            configured_role_id: int = None,
+            rolename: str = None,
+            server_id: int = None,
+            missing_ok: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._roles_configured_delete(
+            configured_role_id,
+            rolename,
+            server_id,
+            missing_ok,
+            timeout
+        ))
+
+    async def roles_get_oid(
+            self, /,
+            role_oid: int = None,
+            rolename: str = None,
+            database_id: int = None,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._roles_get_oid(role_oid, rolename, database_id, timeout))
+
+    async def roles_get(
+            self, /,
+            database_id: int,
+            role_oid: int = None,
+            rolename: str = None,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._roles_get(database_id, role_oid, rolename, timeout))
+
+    async def roles_add(
+            self, /,
+            rolename: str,
+            database_id: int,
+            password: str = None,
+            login: bool = None,
+            exists_ok: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> RoleInfo:
+        return await run_async(self._roles_add(rolename, database_id, password, login, exists_ok, timeout))
+
+    async def roles_delete(
+            self, /,
+            database_id: int,
+            role_oid: int = None,
+            rolename: str = None,
+            missing_ok: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._roles_delete(database_id, role_oid, rolename, missing_ok, timeout))
+
+    async def roles_append_member(
+            self, /,
+            database_id: int,
+            parent_rolename: str = None,
+            parent_role_oid: int = None,
+            rolename: str = None,
+            role_oid: str = None,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return await run_async(self._roles_append_member(
+            database_id,
+            parent_rolename,
+            parent_role_oid,
+            rolename,
+            role_oid,
+            timeout
+        ))
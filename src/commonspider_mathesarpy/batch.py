@@ -0,0 +1,82 @@
+from concurrent.futures import Future
+from typing import Any
+
+from .deadlines import Timeout
+from .exceptions import MathesarException, raise_for_exception
+
+
+class BatchFuture(Future):
+    def __init__(self, batch: "Batch"):
+        super().__init__()
+        self._batch = batch
+
+    def result(self, timeout: float = None):
+        if not self.done():
+            self._batch.flush()
+        return super().result(timeout)
+
+    def exception(self, timeout: float = None):
+        if not self.done():
+            self._batch.flush()
+        return super().exception(timeout)
+
+
+class Batch:
+    def __init__(self, client, max_size: int = 100, timeout: Timeout = None):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._client = client
+        self._max_size = max_size
+        self._timeout = timeout
+        self._pending: list[tuple[dict[str, Any], BatchFuture]] = []
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, method: str, params: dict[str, Any]) -> BatchFuture:
+        future = BatchFuture(self)
+        self._pending.append((self._client._message(method, params), future))
+        if len(self._pending) >= self._max_size:
+            try:
+                self.flush()
+            except Exception:
+                # Transport errors are reported by the futures of the batch
+                pass
+        return future
+
+    def flush(self):
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            data = self._client._post([message for message, _ in pending], self._timeout)
+        except BaseException as exc:
+            for _, future in pending:
+                future.set_exception(exc)
+            raise
+        if isinstance(data, dict):
+            # The server rejected the batch as a whole
+            data = [{**data, "id": message["id"]} for message, _ in pending]
+        responses = {item.get("id"): item for item in data}
+        for message, future in pending:
+            item = responses.get(message["id"])
+            if item is None:
+                future.set_exception(MathesarException(f"Missing response for {message['method']}"))
+                continue
+            try:
+                raise_for_exception(item)
+            except MathesarException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(self._client._result(message["method"], item.get("result")))
+
+    def cancel(self):
+        pending, self._pending = self._pending, []
+        for _, future in pending:
+            future.cancel()
+
+
+def resolve(value):
+    if isinstance(value, Future):
+        return value.result()
+    return value
@@ -0,0 +1,101 @@
+import threading
+import time
+
+from .exceptions import CircuitOpen
+
+
+class Circuit:
+    """
+    A circuit breaker: opens after `threshold` consecutive failures, then
+    rejects requests for `reset_timeout` seconds, after which up to
+    `probes` requests at a time are let through. The first success closes
+    it again, a failed probe opens it for another `reset_timeout`.
+    """
+
+    def __init__(self, name: str, threshold: int, reset_timeout: float, probes: int):
+        self.name = name
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._probes = probes
+        self._failures = 0
+        self._opened_at: float = None
+        self._probing = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            elif time.monotonic() - self._opened_at < self._reset_timeout:
+                return "open"
+            return "half-open"
+
+    def acquire(self) -> bool:
+        """
+        Raise CircuitOpen if the request may not be sent, otherwise return
+        whether it is a probe.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            remaining = self._opened_at + self._reset_timeout - time.monotonic()
+            if remaining <= 0 and self._probing < self._probes:
+                self._probing += 1
+                return True
+        raise CircuitOpen(f"Circuit {self.name} is open", retry_after=max(remaining, 0.0))
+
+    def release(self, probe: bool, failed: bool | None):
+        # `failed` is None when the request was interrupted without an outcome
+        with self._lock:
+            if probe:
+                self._probing -= 1
+            if failed is None:
+                return
+            elif failed:
+                self._failures += 1
+                if probe or self._failures >= self._threshold:
+                    self._opened_at = time.monotonic()
+            else:
+                self._failures = 0
+                self._opened_at = None
+
+
+class Circuits:
+    """
+    Circuit breakers keyed by server URL and method namespace, e.g.
+    `records` for `records.list`. Share an instance between clients so that
+    they all stop sending to a failing server.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0, probes: int = 1):
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._probes = probes
+        self._circuits: dict[tuple[str, str], Circuit] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, method: str) -> Circuit:
+        namespace = method.rsplit(".", 1)[0]
+        with self._lock:
+            circuit = self._circuits.get((url, namespace))
+            if circuit is None:
+                circuit = Circuit(f"{namespace} of {url}", self._threshold, self._reset_timeout, self._probes)
+                self._circuits[(url, namespace)] = circuit
+            return circuit
+
+
+def acquire_all(circuits: list[Circuit]) -> list[bool]:
+    probes = []
+    try:
+        for circuit in circuits:
+            probes.append(circuit.acquire())
+    except CircuitOpen:
+        release_all(circuits[:len(probes)], probes, None)
+        raise
+    return probes
+
+
+def release_all(circuits: list[Circuit], probes: list[bool], failed: bool | None):
+    for circuit, probe in zip(circuits, probes):
+        circuit.release(probe, failed)
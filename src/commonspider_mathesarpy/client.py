@@ -1,72 +1,405 @@
 import inspect
-import random
+import itertools
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from fnmatch import fnmatchcase
 from functools import wraps
 from typing import Any
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
-from requests import Session
+from requests import ConnectionError, ConnectTimeout, Session, Timeout
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError, ReadTimeoutError
 
-from .exceptions import raise_for_exception
+from .batch import Batch
+from . import deadlines
+from .breaker import Circuit, Circuits, acquire_all, release_all
+from .codec import Codec, default_codec
+from .compression import CompressionStats, accept_encoding, compress
+from .exceptions import DeadlineExceeded, ServerError, raise_for_exception
+from .limits import Limiter
+from .retry import RetryBudget, RetryPolicy, parse_retry_after
+from .typed import convert, struct_annotation
+
+
+class PoolAdapter(HTTPAdapter):
+    def __init__(self, tcp_nodelay: bool = True, keep_alive: bool = True, **kwargs):
+        self._socket_options = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, int(tcp_nodelay)),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, int(keep_alive)),
+        ]
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", self._socket_options)
+        super().init_poolmanager(*args, **kwargs)
 
 
 class Client:
-    def __init__(self, url: str):
+    """
+    A session with a Mathesar server.
+
+    A single client can be shared between threads: the login state and the
+    CSRF token are guarded by a lock, and concurrent requests are served by
+    a connection pool of `pool_maxsize` connections per host. Set it to at
+    least the number of threads, or use `pool_block` to make extra threads
+    wait for a free connection instead of opening and discarding new ones.
+    With `keep_alive` disabled every request uses a fresh connection.
+
+    Request and response bodies go through `codec`, which defaults to
+    orjson or msgspec when installed and to the standard json module
+    otherwise, which they also use for integers beyond 64 bits. With `structs` the results are returned as the slotted
+    dataclasses of the `structs` module instead of plain dicts.
+
+    Failed requests are sent again as configured by `retry`, see
+    `RetryPolicy`; pass False to disable retries.
+
+    `limits` maps method patterns such as `"records.*"` or `"*"` to the
+    `Limiter` applied to their requests, the longest matching pattern
+    wins. A batch takes one slot of each limiter of its methods and one
+    rate token per call.
+
+    With `circuits` requests to a server and method namespace which keeps
+    failing are rejected with `CircuitOpen` instead of being sent, see
+    `Circuits`.
+
+    Requests time out after `timeout`, either seconds or a (connect, read)
+    tuple, which every API method also accepts to override it for one call.
+    Use `deadline` to bound the total time of several calls.
+
+    Responses are requested compressed with any encoding urllib3 can decode
+    (gzip and deflate, br and zstd with the `compression` extra). Request
+    bodies of at least `compress_threshold` bytes are gzipped, which the
+    server or a proxy in front of it must accept. The bytes sent and
+    received before and after compression are counted in
+    `compression_stats`.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            keep_alive: bool = True,
+            tcp_nodelay: bool = True,
+            codec: Codec = None,
+            structs: bool = False,
+            retry: RetryPolicy | bool = True,
+            limits: dict[str, Limiter] = None,
+            circuits: Circuits = None,
+            timeout: deadlines.Timeout = (10.0, 300.0),
+            compress_threshold: int = None
+    ):
         self._url = url
-        self._session = Session()
+        self._timeout = timeout
+        self._compress_threshold = compress_threshold
+        self.compression_stats = CompressionStats()
+        self._codec = codec or default_codec()
+        self._structs = structs
+        if retry is True:
+            retry = RetryPolicy()
+        self._retry: RetryPolicy | None = retry or None
+        self._retry_budget = RetryBudget(retry.budget_ratio, retry.budget_burst) if retry else None
+        self._limits = dict(limits or {})
+        self._method_limiters: dict[str, Limiter | None] = {}
+        self._circuits = circuits
+        self._session = self._create_session(pool_connections, pool_maxsize, pool_block, keep_alive, tcp_nodelay)
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._login_lock = threading.Lock()
+        self._csrf_token: str = None
+
+    def _create_session(
+            self,
+            pool_connections: int,
+            pool_maxsize: int,
+            pool_block: bool,
+            keep_alive: bool,
+            tcp_nodelay: bool
+    ) -> Session | None:
+        session = Session()
+        session.headers["Accept-Encoding"] = accept_encoding
+        adapter = PoolAdapter(
+            tcp_nodelay=tcp_nodelay,
+            keep_alive=keep_alive,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
 
     def login(self, username: str, password: str):
         login_url = urljoin(self._url, "/auth/login/")
 
-        response = self._session.get(login_url)
-        dom = BeautifulSoup(response.text)
-        token = dom.find("input", {"name": "csrfmiddlewaretoken"})["value"]
+        with self._login_lock:
+            response = self._session.get(login_url, timeout=deadlines.bounded_timeout(self._timeout))
+            dom = BeautifulSoup(response.text, "html.parser")
+            token = dom.find("input", {"name": "csrfmiddlewaretoken"})["value"]
 
-        response = self._session.post(
-            login_url,
-            data={
-                "username": username,
-                "password": password,
-                "csrfmiddlewaretoken": token,
-            },
-            headers={
-                "Referer": login_url
-            }
-        )
-        content = response.text
-        response.raise_for_status()
+            response = self._session.post(
+                login_url,
+                data={
+                    "username": username,
+                    "password": password,
+                    "csrfmiddlewaretoken": token,
+                },
+                headers={
+                    "Referer": login_url
+                },
+                timeout=deadlines.bounded_timeout(self._timeout)
+            )
+            response.raise_for_status()
+            self._csrf_token = self._session.cookies.get("csrftoken")
 
-    def request(self, method: str, params: dict[str, Any]):
+    def _csrf(self) -> str:
+        with self._login_lock:
+            if self._csrf_token is None:
+                self._csrf_token = self._session.cookies["csrftoken"]
+            return self._csrf_token
+
+    def deadline(self, seconds: float):
+        """
+        Make the calls in this block fail with `DeadlineExceeded` once
+        `seconds` have passed, including the calls made by the helpers of
+        `Mathesar` and their worker threads, and shorten the timeout of any
+        request to the time left.
+        """
+        return deadlines.deadline(seconds)
+
+    @contextmanager
+    def batch(self, max_size: int = 100, timeout: deadlines.Timeout = None):
+        """
+        Collect the calls made in this thread into JSON-RPC batches.
+
+        Inside the block every API call returns a future which resolves when
+        the batch is sent, either because `max_size` calls are pending, on
+        exit, or when the result of a pending future is requested. Errors are
+        raised per call by the corresponding future. Helpers which need a
+        result to go on, such as the iterators and the `exists_ok` and
+        `missing_ok` variants of `Mathesar`, send the pending calls early and
+        return plain results. The batches are sent with `timeout`, the
+        timeouts of the calls themselves are ignored.
+        """
+        batch = Batch(self, max_size=max_size, timeout=timeout)
+        previous = getattr(self._local, "batch", None)
+        self._local.batch = batch
+        try:
+            yield batch
+        except BaseException:
+            batch.cancel()
+            raise
+        else:
+            batch.flush()
+        finally:
+            self._local.batch = previous
+
+    def request(self, method: str, params: dict[str, Any], timeout: deadlines.Timeout = None):
+        batch = getattr(self._local, "batch", None)
+        if batch is not None:
+            return batch.add(method, params)
+        data = self._post(self._message(method, params), timeout)
+        raise_for_exception(data)
+        return self._result(method, data["result"])
+
+    def _result(self, method: str, result: Any) -> Any:
+        if self._structs and method in methods_returns:
+            return convert(result, struct_annotation(methods_returns[method]))
+        return result
+
+    def _message(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+            "params": params,
+        }
+
+    def _post(self, payload: dict[str, Any] | list[dict[str, Any]], timeout: deadlines.Timeout = None):
+        body, encoding = self._encode(payload)
+        methods = _methods(payload)
+        limiters = self._limiters(methods)
+        circuits = self._circuits_of(methods)
+        if timeout is None:
+            timeout = self._timeout
+        if self._retry_budget is not None:
+            self._retry_budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return self._limited_send(body, encoding, limiters, circuits, timeout)
+            except DeadlineExceeded:
+                raise
+            except Exception as exc:
+                if self._timed_out(exc) and (left := deadlines.remaining()) is not None and left <= 0:
+                    raise DeadlineExceeded("Deadline exceeded") from exc
+                delay = self._retry_delay(exc, methods, attempt)
+                if delay is None:
+                    raise
+            attempt += 1
+            time.sleep(delay)
+
+    def _limiter(self, method: str) -> Limiter | None:
+        try:
+            return self._method_limiters[method]
+        except KeyError:
+            patterns = [pattern for pattern in self._limits if fnmatchcase(method, pattern)]
+            limiter = self._limits[max(patterns, key=len)] if patterns else None
+            self._method_limiters[method] = limiter
+            return limiter
+
+    def _limiters(self, methods: list[str]) -> list[tuple[Limiter, int]]:
+        if not self._limits:
+            return []
+        counts = {}
+        for method in methods:
+            if (limiter := self._limiter(method)) is not None:
+                counts[limiter] = counts.get(limiter, 0) + 1
+        # Always acquired in the same order, so that requests waiting for several limiters cannot deadlock
+        return sorted(counts.items(), key=lambda item: id(item[0]))
+
+    def _circuits_of(self, methods: list[str]) -> list[Circuit]:
+        if self._circuits is None:
+            return []
+        return list({self._circuits.get(self._url, method): None for method in methods})
+
+    def _limited_send(
+            self,
+            body: bytes,
+            encoding: str | None,
+            limiters: list[tuple[Limiter, int]],
+            circuits: list[Circuit],
+            timeout: deadlines.Timeout
+    ):
+        probes = acquire_all(circuits)
+        failed = None
+        acquired = []
+        try:
+            for limiter, count in limiters:
+                if not limiter.acquire(count, deadlines.remaining()):
+                    raise DeadlineExceeded("Deadline exceeded waiting for the request limits")
+                acquired.append(limiter)
+            # Only the time left after waiting for the limiters counts
+            connect_read = deadlines.bounded_timeout(timeout)
+            start = time.monotonic()
+            try:
+                data = self._send(body, encoding, connect_read)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                for limiter, _ in limiters:
+                    limiter.release(time.monotonic() - start, bool(failed))
+                acquired = []
+            failed = False
+            return data
+        finally:
+            for limiter in acquired:
+                limiter.release(None)
+            release_all(circuits, probes, failed)
+
+    def _encode(self, payload: dict[str, Any] | list[dict[str, Any]]) -> tuple[bytes, str | None]:
+        body = self._codec.encode(payload)
+        compressed, encoding = compress(body, self._compress_threshold)
+        self.compression_stats.add_request(len(body), len(compressed))
+        return compressed, encoding
+
+    def _headers(self, encoding: str | None) -> dict[str, str]:
+        headers = {
+            "X-CSRFToken": self._csrf(),
+            "Content-Type": "application/json",
+        }
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        return headers
+
+    def _send(self, body: bytes, encoding: str | None, timeout: tuple[float | None, float | None]):
         response = self._session.post(
             urljoin(self._url, "/api/rpc/v0/"),
-            headers={
-                "X-CSRFToken": self._session.cookies["csrftoken"],
-            },
-            json={
-                "jsonrpc": "2.0",
-                "id": random.randint(1, 99999),
-                "method": method,
-                "params": params,
-            }
+            headers=self._headers(encoding),
+            data=body,
+            timeout=timeout
         )
-        data = response.json()
-        raise_for_exception(data)
-        return data["result"]
+        content = response.content
+        # tell() counts the bytes read from the socket, before decoding
+        self.compression_stats.add_response(len(content), response.raw.tell() or len(content))
+        return self._decode(response.status_code, response.headers.get("Retry-After"), content)
+
+    def _decode(self, status: int, retry_after: str | None, content: bytes):
+        try:
+            data = self._codec.decode(content)
+        except Exception:
+            # json and orjson raise ValueError, msgspec its own DecodeError
+            data = None
+        if isinstance(data, list) or isinstance(data, dict) and ("result" in data or "error" in data):
+            return data
+        raise ServerError(
+            f"Unexpected response with status {status}: {content[:200]!r}",
+            status=status,
+            retry_after=parse_retry_after(retry_after)
+        )
+
+    def _sent(self, error: Exception) -> bool | None:
+        # Whether a failed request may have reached the server, None for errors which are not retried
+        if isinstance(error, ConnectTimeout):
+            return False
+        elif isinstance(error, ConnectionError):
+            reason = getattr(error.args[0], "reason", None) if error.args else None
+            return not isinstance(reason, NewConnectionError)
+        elif isinstance(error, Timeout):
+            return True
+        return None
+
+    def _timed_out(self, error: Exception) -> bool:
+        # Read timeouts while streaming the body come as a ConnectionError
+        return isinstance(error, Timeout) or isinstance(error, ConnectionError) and bool(error.args) \
+            and isinstance(error.args[0], ReadTimeoutError)
+
+    def _retry_delay(self, error: Exception, methods: list[str], attempt: int) -> float | None:
+        if self._retry is None:
+            return None
+        if isinstance(error, ServerError):
+            delay = self._retry.delay(methods, attempt, status=error.status, retry_after=error.retry_after)
+        else:
+            sent = self._sent(error)
+            if sent is None:
+                return None
+            delay = self._retry.delay(methods, attempt, sent=sent)
+        left = deadlines.remaining()
+        if delay is None or left is not None and delay >= left or not self._retry_budget.withdraw():
+            return None
+        return delay
+
 
+def _methods(payload: dict[str, Any] | list[dict[str, Any]]) -> list[str]:
+    if isinstance(payload, dict):
+        return [payload["method"]]
+    return [message["method"] for message in payload]
 
 methods_params = {}
+methods_returns = {}
 
 
 def api(endpoint: str):
     def decorator(function):
         @wraps(function)
-        def wrapper(self: Client, **kwargs):
-            return self.request(endpoint, kwargs)
+        def wrapper(self: Client, *, timeout: deadlines.Timeout = None, **kwargs):
+            return self.request(endpoint, kwargs, timeout)
 
         methods_params[endpoint] = params = {
             param.name: param.annotation
             for param in inspect.signature(function).parameters.values()
         }
         params.pop("self", None)
+        return_annotation = inspect.signature(function).return_annotation
+        if return_annotation is not inspect.Signature.empty:
+            methods_returns[endpoint] = return_annotation
         return wrapper
     return decorator
@@ -0,0 +1,108 @@
+import dataclasses
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _default(obj: Any) -> Any:
+    # Structs passed back as parameters; orjson and msgspec encode dataclasses natively
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class Codec:
+    name: str
+
+    def encode(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class JSONCodec(Codec):
+    name = "json"
+
+    def encode(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+# orjson and msgspec decode integers beyond 64 bits lossily as floats or reject them, and
+# fail to encode them. Bodies with a run of 19 digits, which may be such an integer, and
+# objects they fail on go through the json module instead.
+_digits = bytes.maketrans(b"123456789", b"000000000")
+_long_number = b"0" * 19
+
+
+def _may_overflow(data: bytes) -> bool:
+    return _long_number in data.translate(_digits)
+
+
+class OrjsonCodec(Codec):
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson")
+        self._fallback = JSONCodec()
+
+    def encode(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return self._fallback.encode(obj)
+
+    def decode(self, data: bytes) -> Any:
+        if _may_overflow(data):
+            return self._fallback.decode(data)
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            return self._fallback.decode(data)
+
+
+class MsgspecCodec(Codec):
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("MsgspecCodec requires msgspec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+        self._fallback = JSONCodec()
+
+    def encode(self, obj: Any) -> bytes:
+        try:
+            return self._encoder.encode(obj)
+        except (msgspec.EncodeError, OverflowError, TypeError):
+            return self._fallback.encode(obj)
+
+    def decode(self, data: bytes) -> Any:
+        if _may_overflow(data):
+            return self._fallback.decode(data)
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError:
+            return self._fallback.decode(data)
+
+
+def default_codec() -> Codec:
+    if orjson is not None:
+        return OrjsonCodec()
+    elif msgspec is not None:
+        return MsgspecCodec()
+    else:
+        return JSONCodec()
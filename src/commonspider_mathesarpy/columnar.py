@@ -0,0 +1,164 @@
+from array import array
+from typing import Any, Iterable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_integer_types = {"smallint", "integer", "bigint"}
+_float_types = {"real", "double precision"}
+
+# array.array typecodes (and numpy dtypes) for the kinds of column with a fixed size representation
+_typecodes = {
+    "int": "q",
+    "float": "d",
+    "bool": "b",
+}
+_dtypes = {
+    "q": "int64",
+    "d": "float64",
+    "b": "bool",
+}
+_fill = {
+    "q": 0,
+    "d": float("nan"),
+    "b": False,
+}
+_cast = {
+    "q": int,
+    "d": float,
+    "b": bool,
+}
+
+
+def column_kind(info: dict[str, Any]) -> str:
+    """
+    Return how the values of a column are stored: "int", "float", "bool"
+    or "object".
+
+    Numeric values become 64-bit integers when their precision and a scale
+    of 0 guarantee they fit, and are otherwise kept as objects so that no
+    digits are lost.
+    """
+    column_type = info.get("type")
+    if column_type in _integer_types:
+        return "int"
+    elif column_type in _float_types:
+        return "float"
+    elif column_type == "numeric":
+        options = info.get("type_options") or {}
+        precision = options.get("precision")
+        if options.get("scale") == 0 and precision is not None and precision <= 18:
+            return "int"
+        return "object"
+    elif column_type == "boolean":
+        return "bool"
+    return "object"
+
+
+def typecode(info: dict[str, Any]) -> str | None:
+    return _typecodes.get(column_kind(info))
+
+
+class ColumnBuffer:
+    """
+    Values of a single column, accumulated page by page.
+
+    Fixed size types are stored in a typed array where nulls are replaced
+    by a fill value (NaN for floats) and flagged in `nulls`; any other type
+    is kept as a list of Python objects.
+    """
+
+    def __init__(self, typecode: str = None):
+        self.typecode = typecode
+        self._chunks = []
+        self._nulls = []
+        self._has_nulls = False
+
+    def extend(self, values: list[Any]):
+        if self.typecode is None:
+            self._chunks.append(values)
+            return
+        nulls = [value is None for value in values]
+        if any(nulls):
+            self._has_nulls = True
+            fill = _fill[self.typecode]
+            values = [fill if value is None else value for value in values]
+        cast = _cast[self.typecode]
+        values = [cast(value) for value in values]
+        if numpy is not None:
+            self._chunks.append(numpy.array(values, dtype=_dtypes[self.typecode]))
+            self._nulls.append(numpy.array(nulls, dtype=bool))
+        else:
+            self._chunks.append(array(self.typecode, values))
+            self._nulls.append(array("b", nulls))
+
+    def values(self):
+        if self.typecode is None:
+            if numpy is not None:
+                values = numpy.empty(sum(len(chunk) for chunk in self._chunks), dtype=object)
+                offset = 0
+                for chunk in self._chunks:
+                    values[offset:offset + len(chunk)] = chunk
+                    offset += len(chunk)
+                return values
+            return [value for chunk in self._chunks for value in chunk]
+        return self._concatenate(self._chunks, self.typecode)
+
+    def nulls(self):
+        if self.typecode is None or not self._has_nulls:
+            return None
+        return self._concatenate(self._nulls, "b")
+
+    @staticmethod
+    def _concatenate(chunks: list, typecode: str):
+        if numpy is not None:
+            if not chunks:
+                return numpy.empty(0, dtype=_dtypes[typecode])
+            return numpy.concatenate(chunks)
+        result = array(typecode)
+        for chunk in chunks:
+            result.extend(chunk)
+        return result
+
+
+class ColumnarResult:
+    def __init__(self, columns: dict[str, Any], nulls: dict[str, Any], count: int):
+        self.columns = columns
+        self.nulls = nulls
+        self.count = count
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"ColumnarResult(count={self.count}, columns={list(self.columns)})"
+
+
+def decode_pages(
+        pages: Iterable[list[dict[str, Any]]],
+        keys: dict[str, str],
+        types: dict[str, str | None]
+) -> ColumnarResult:
+    """
+    Decode pages of rows into per-column buffers.
+
+    `keys` maps each output column name to its key in the rows and `types`
+    maps it to the typecode of its buffer.
+    """
+    buffers = {name: ColumnBuffer(types.get(name)) for name in keys}
+    count = 0
+    for rows in pages:
+        count += len(rows)
+        for name, key in keys.items():
+            buffers[name].extend([row.get(key) for row in rows])
+    nulls = {name: buffer.nulls() for name, buffer in buffers.items()}
+    return ColumnarResult(
+        columns={name: buffer.values() for name, buffer in buffers.items()},
+        nulls={name: mask for name, mask in nulls.items() if mask is not None},
+        count=count
+    )
@@ -0,0 +1,64 @@
+import gzip
+import threading
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+# The response encodings urllib3 can decode here: gzip and deflate, plus br
+# and zstd when brotli and zstandard are installed
+accept_encoding = ACCEPT_ENCODING.replace(",", ", ")
+
+
+def compress(body: bytes, threshold: int | None, level: int = 6) -> tuple[bytes, str | None]:
+    """
+    Gzip `body` if it is at least `threshold` bytes long and shrinks, and
+    return it with its content encoding.
+    """
+    if threshold is None or len(body) < threshold:
+        return body, None
+    compressed = gzip.compress(body, compresslevel=level)
+    if len(compressed) >= len(body):
+        return body, None
+    return compressed, "gzip"
+
+
+class CompressionStats:
+    """
+    Bytes sent and received by a client, before and after compression.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.requests_compressed = 0
+        self.request_bytes = 0
+        self.request_bytes_sent = 0
+        self.responses = 0
+        self.responses_compressed = 0
+        self.response_bytes = 0
+        self.response_bytes_received = 0
+        self._lock = threading.Lock()
+
+    def add_request(self, size: int, sent: int):
+        with self._lock:
+            self.requests += 1
+            self.requests_compressed += sent < size
+            self.request_bytes += size
+            self.request_bytes_sent += sent
+
+    def add_response(self, size: int, received: int):
+        with self._lock:
+            self.responses += 1
+            self.responses_compressed += received < size
+            self.response_bytes += size
+            self.response_bytes_received += received
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.request_bytes - self.request_bytes_sent + self.response_bytes - self.response_bytes_received
+
+    def __repr__(self):
+        return (
+            f"CompressionStats(requests={self.requests}, request_bytes={self.request_bytes}, "
+            f"request_bytes_sent={self.request_bytes_sent}, responses={self.responses}, "
+            f"response_bytes={self.response_bytes}, response_bytes_received={self.response_bytes_received}, "
+            f"bytes_saved={self.bytes_saved})"
+        )
@@ -0,0 +1,70 @@
+from typing import Any
+
+from .classes import ColumnInfo
+from .columnar import column_kind
+
+try:
+    import numpy
+    import pandas
+except ImportError:
+    numpy = None
+    pandas = None
+
+_dtypes = {
+    "int": "int64",
+    "float": "float64",
+    "bool": "bool",
+    "object": "object",
+}
+
+
+class FrameBuilder:
+    """
+    Fill preallocated column buffers page by page and build a DataFrame
+    over them without copying.
+
+    Integers and booleans with nulls become pandas nullable arrays,
+    floats use NaN for nulls and any other type is kept as objects.
+    """
+
+    def __init__(self, columns: list[ColumnInfo], size: int):
+        if pandas is None:
+            raise ImportError("DataFrame export requires pandas: pip install commonspider_mathesarpy[pandas]")
+        self._columns = columns
+        self._kinds = [column_kind(col) for col in columns]
+        self._size = size
+        self._length = 0
+        self._values = [numpy.empty(size, dtype=_dtypes[kind]) for kind in self._kinds]
+        self._masks = [numpy.zeros(size, dtype=bool) for _ in columns]
+
+    def _grow(self, size: int):
+        self._values = [numpy.resize(values, size) for values in self._values]
+        self._masks = [numpy.resize(mask, size) for mask in self._masks]
+        self._size = size
+
+    def add(self, rows: list[dict[str, Any]]):
+        end = self._length + len(rows)
+        if end > self._size:
+            self._grow(max(end, 2 * self._size))
+        for col, kind, values, mask in zip(self._columns, self._kinds, self._values, self._masks):
+            key = str(col["id"])
+            column = [row.get(key) for row in rows]
+            nulls = [value is None for value in column]
+            if kind != "object" and any(nulls):
+                fill = numpy.nan if kind == "float" else 0
+                column = [fill if null else value for value, null in zip(column, nulls)]
+            values[self._length:end] = column
+            mask[self._length:end] = nulls
+        self._length = end
+
+    def build(self) -> "pandas.DataFrame":
+        data = {}
+        for col, kind, values, mask in zip(self._columns, self._kinds, self._values, self._masks):
+            values = values[:self._length]
+            mask = mask[:self._length]
+            if kind == "int" and mask.any():
+                values = pandas.arrays.IntegerArray(values, mask)
+            elif kind == "bool" and mask.any():
+                values = pandas.arrays.BooleanArray(values, mask)
+            data[col["name"]] = values
+        return pandas.DataFrame(data, copy=False)
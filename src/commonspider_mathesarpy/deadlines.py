@@ -0,0 +1,50 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from .exceptions import DeadlineExceeded
+
+# Connect and read timeouts in seconds, a single value for both, or None to wait forever
+Timeout = float | tuple[float | None, float | None] | None
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float):
+    """
+    Bound the time spent by the requests sent in this block, from this
+    thread or task, to `seconds` in total. A nested deadline cannot extend
+    the current one.
+    """
+    at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        at = min(at, current)
+    token = _deadline.set(at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    at = _deadline.get()
+    return None if at is None else at - time.monotonic()
+
+
+def bounded_timeout(timeout: Timeout) -> tuple[float | None, float | None]:
+    """
+    Split `timeout` into connect and read timeouts, shortened to the time
+    left before the current deadline.
+    """
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    left = remaining()
+    if left is None:
+        return connect, read
+    if left <= 0:
+        raise DeadlineExceeded("Deadline exceeded")
+    return (
+        left if connect is None else min(connect, left),
+        left if read is None else min(read, left),
+    )
@@ -8,8 +8,9 @@ def raise_for_exception(data: dict):
 
 
 class MathesarException(Exception):
-    def __init_subclass__(cls, code: int, **kwargs):
-        exceptions[code] = cls
+    def __init_subclass__(cls, code: int = None, **kwargs):
+        if code is not None:
+            exceptions[code] = cls
 
 
 exceptions = defaultdict(lambda: MathesarException)
@@ -37,3 +38,33 @@ class UndefinedObject(MathesarException, code=-30257):
 
 class Unauthorized(MathesarException, code=-32603):
     ...
+
+
+class ServerError(MathesarException):
+    """
+    The server answered with an HTTP error or a body that is not a JSON-RPC
+    response, e.g. a 502 page of a proxy.
+    """
+
+    def __init__(self, message: str, status: int = None, retry_after: float = None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CircuitOpen(MathesarException):
+    """
+    The request was not sent because recent requests to the same server and
+    namespace failed, see `breaker.Circuits`.
+    """
+
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(MathesarException, TimeoutError):
+    """
+    The deadline of the calling code passed, or would pass, before the
+    request could be sent or answered, see `Client.deadline`.
+    """
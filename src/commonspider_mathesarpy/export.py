@@ -0,0 +1,75 @@
+import csv
+import gzip
+import io
+import os
+from typing import Any, BinaryIO, Iterable, Literal
+
+from .codec import Codec, default_codec
+
+Format = Literal["csv", "jsonl"]
+
+
+def write_rows(
+        target: str | os.PathLike | BinaryIO,
+        pages: Iterable[list[dict[str, Any]]],
+        keys: dict[str, str],
+        format: Format = "csv",
+        compress: bool = None,
+        buffer_size: int = 1 << 16,
+        codec: Codec = None
+) -> int:
+    """
+    Stream pages of rows to `target` as CSV or JSON Lines and return the
+    number of rows written.
+
+    `keys` maps each output column name to its key in the rows. The output
+    is gzipped when `compress` is set, which defaults to whether `target`
+    is a path ending in `.gz`. Only one page is held at a time, writes go
+    through a buffer of `buffer_size` bytes.
+    """
+    if format not in ("csv", "jsonl"):
+        raise ValueError(f"Unknown export format {format!r}")
+    if compress is None:
+        compress = isinstance(target, (str, os.PathLike)) and os.fspath(target).endswith(".gz")
+    codec = codec or default_codec()
+    names = list(keys)
+    count = 0
+    owned = isinstance(target, (str, os.PathLike))
+    raw = open(target, "wb", buffering=buffer_size) if owned else target
+    stream = gzip.GzipFile(fileobj=raw, mode="wb") if compress else raw
+    text = None
+    try:
+        if format == "csv":
+            text = io.TextIOWrapper(stream, encoding="utf-8", newline="", write_through=False)
+            writer = csv.writer(text)
+            writer.writerow(names)
+            for rows in pages:
+                writer.writerows(
+                    [_csv_value(row.get(key), codec) for key in keys.values()]
+                    for row in rows
+                )
+                count += len(rows)
+        else:
+            for rows in pages:
+                stream.write(b"".join(
+                    codec.encode({name: row.get(key) for name, key in keys.items()}) + b"\n"
+                    for row in rows
+                ))
+                count += len(rows)
+    finally:
+        if text is not None:
+            # Flushes the wrapper, which would otherwise close the stream when garbage collected
+            text.detach()
+        if compress:
+            stream.close()
+        if owned:
+            raw.close()
+        else:
+            raw.flush()
+    return count
+
+
+def _csv_value(value: Any, codec: Codec) -> Any:
+    if isinstance(value, (dict, list)):
+        return codec.encode(value).decode()
+    return value
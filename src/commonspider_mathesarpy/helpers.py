@@ -0,0 +1,583 @@
+import inspect
+from functools import partial
+from itertools import chain
+from typing import Any, Callable, Generator, Iterable, Iterator
+
+from .api import API
+from .batch import resolve
+from .classes import RecordList, SearchParam, UserDef
+from .deadlines import Timeout
+from .exceptions import DuplicateObject, IntegrityError, UndefinedObject, DoesNotExist
+from .typed import Struct
+
+# The wrappers of `Helpers` are generators which yield the calls they need
+# made, as functions without arguments, and are sent back their results.
+# `run` makes the calls and `run_async` awaits them, so that `Mathesar` and
+# `AsyncMathesar` share a single implementation.
+Steps = Generator[Callable[[], Any], Any, Any]
+
+# The list method of each kind of metadata, its scope parameter, and the id
+# and name keys of its items
+metadata_kinds = {
+    "users": ("users_list", None, "id", "username"),
+    "roles": ("roles_list", "database_id", "oid", "name"),
+    "configured_roles": ("roles_configured_list", "server_id", "id", "name"),
+    "collaborators": ("collaborators_list", "database_id", "id", "user_id"),
+}
+
+
+def run(steps: Steps) -> Any:
+    try:
+        call = next(steps)
+        while True:
+            try:
+                # Results of calls made inside a batch are needed right away
+                result = resolve(call())
+            except Exception as exc:
+                call = steps.throw(exc)
+            else:
+                call = steps.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+
+async def run_async(steps: Steps) -> Any:
+    try:
+        call = next(steps)
+        while True:
+            try:
+                result = call()
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception as exc:
+                call = steps.throw(exc)
+            else:
+                call = steps.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+
+def _iter_records(record_list: RecordList | Iterable[RecordList] | Iterable[dict]) -> Iterator[dict]:
+    if isinstance(record_list, (dict, Struct)):
+        yield from record_list["results"]
+        return
+    for item in record_list:
+        if isinstance(item, Struct) or "results" in item:
+            yield from item["results"]
+        else:
+            yield item
+
+
+class Helpers:
+    """
+    The convenience wrappers shared by `Mathesar` and `AsyncMathesar`.
+
+    Subclasses provide `get_columns` and `_lookup`, which return (or
+    resolve to) the columns of a table and an object with the `by_id` and
+    `by_name` methods of `metadata.Index` for a kind of metadata.
+    """
+
+    def _lookup(self, kind: str, scope: Any = None, timeout: Timeout = None):
+        raise NotImplementedError
+
+    def _update_indexes(self, kind: str, scopes: tuple = None, add: Any = None, remove: Any = None,
+                        invalidate: bool = False):
+        # Only needed by clients which keep indexes
+        pass
+
+    def _list_call(self, kind: str, scope: Any = None) -> Callable[[], Any]:
+        method, param, _, _ = metadata_kinds[kind]
+        return partial(getattr(self, method), **({} if param is None else {param: scope}))
+
+    def _search_params(
+            self,
+            table_oid: int,
+            database_id: int,
+            search_params: list[SearchParam],
+            search_literals: dict[str, str] | None,
+            timeout: Timeout
+    ) -> Steps:
+        if search_literals is None:
+            return search_params
+        columns = yield partial(self.get_columns, table_oid=table_oid, database_id=database_id, timeout=timeout)
+        search_params = list(search_params)
+        search_params.extend(
+            SearchParam(
+                attnum=columns[name],
+                literal=value
+            )
+            for name, value in search_literals.items()
+        )
+        return search_params
+
+    def _record_def(
+            self,
+            record_def: dict[str | int, Any],
+            table_oid: int,
+            database_id: int,
+            timeout: Timeout
+    ) -> Steps:
+        if any(isinstance(key, str) for key in record_def):
+            columns = yield partial(self.get_columns, table_oid=table_oid, database_id=database_id, timeout=timeout)
+            record_def = {
+                columns[key]: value
+                for key, value in record_def.items()
+            }
+        return record_def
+
+    def _record_ids(
+            self,
+            record_ids: Iterable[Any],
+            record_list: RecordList | Iterable[RecordList] | Iterable[dict] | None,
+            id_col: str | int | None,
+            table_oid: int,
+            database_id: int,
+            timeout: Timeout
+    ) -> Steps:
+        if record_list is None:
+            return record_ids
+        columns = yield partial(self.get_columns, table_oid=table_oid, database_id=database_id, timeout=timeout)
+        if id_col is None:
+            id_col = str(columns.primary_key[0])
+        else:
+            id_col = str(columns[id_col])
+        return chain(record_ids, (
+            record[id_col]
+            for record in _iter_records(record_list)
+        ))
+
+    def _users_get_id(self, user_id: int | None, username: str | None, timeout: Timeout) -> Steps:
+        if username is not None:
+            users = yield partial(self._lookup, "users", None, timeout)
+            info = users.by_name(username)
+            if info is None:
+                raise DoesNotExist(f"User matching query does not exist.")
+            if user_id is None or user_id == info["id"]:
+                return info["id"]
+            else:
+                raise ValueError(f"User ID of {username} is not {user_id}")
+        elif user_id is not None:
+            return user_id
+        else:
+            raise TypeError("Missing either user_id or username")
+
+    def _users_get(self, user_id: int | None, username: str | None, timeout: Timeout) -> Steps:
+        if username is None and user_id is None:
+            raise TypeError("Missing either user_id or username")
+        users = yield partial(self._lookup, "users", None, timeout)
+        if username is not None:
+            info = users.by_name(username)
+            if info is not None:
+                if user_id is None or user_id == info["id"]:
+                    return info
+                else:
+                    raise ValueError(f"User ID of {username} is not {user_id}")
+        if user_id is not None:
+            info = users.by_id(user_id)
+            if info is not None:
+                return info
+        raise DoesNotExist("User matching query does not exist.")
+
+    def _users_add(self, user_def: UserDef, exists_ok: bool, timeout: Timeout) -> Steps:
+        try:
+            info = yield partial(API.users_add, self, user_def=user_def, timeout=timeout)
+        except IntegrityError:
+            if exists_ok:
+                return (yield from self._users_get(None, user_def["username"], timeout))
+            else:
+                raise
+        self._update_indexes("users", add=info)
+        return info
+
+    def _users_delete(
+            self,
+            user_id: int | None,
+            username: str | None,
+            missing_ok: bool,
+            timeout: Timeout
+    ) -> Steps:
+        try:
+            user_id = yield from self._users_get_id(user_id, username, timeout)
+            result = yield partial(API.users_delete, self, user_id=user_id, timeout=timeout)
+        except DoesNotExist:
+            if not missing_ok:
+                raise
+        else:
+            self._update_indexes("users", remove=user_id)
+            self._update_indexes("collaborators", invalidate=True)
+            return result
+
+    def _collaborators_full_add(
+            self,
+            username: str,
+            password: str,
+            database_id: int,
+            is_superuser: bool,
+            email: str | None,
+            full_name: str | None,
+            display_language: str | None,
+            rolename: str | None,
+            role_password: str | None,
+            exists_ok: bool,
+            timeout: Timeout
+    ) -> Steps:
+        rolename = rolename or username
+        role_password = role_password or password
+        yield from self._roles_add(
+            rolename=rolename,
+            database_id=database_id,
+            password=role_password,
+            login=True,
+            exists_ok=exists_ok,
+            timeout=timeout
+        )
+        configured_role_info = yield from self._roles_configured_add(
+            server_id=database_id,
+            name=rolename,
+            password=role_password,
+            exists_ok=exists_ok,
+            timeout=timeout
+        )
+        user_def = UserDef(
+            username=username,
+            password=password,
+            is_superuser=is_superuser,
+            email=email,
+            full_name=full_name,
+            display_language=display_language
+        )
+        user_def = UserDef(**{
+            k: v
+            for k, v in user_def.items()
+            if v is not None
+        })
+        user_info = yield from self._users_add(user_def, exists_ok, timeout)
+        return (yield from self._collaborators_add(
+            database_id=database_id,
+            user_id=user_info["id"],
+            username=None,
+            configured_role_id=configured_role_info["id"],
+            rolename=None,
+            exists_ok=exists_ok,
+            timeout=timeout
+        ))
+
+    def _collaborators_full_delete(
+            self,
+            username: str,
+            database_id: int,
+            rolename: str | None,
+            missing_ok: bool,
+            timeout: Timeout
+    ) -> Steps:
+        rolename = rolename or username
+        yield from self._collaborators_delete(None, username, database_id, missing_ok, timeout)
+        yield from self._users_delete(None, username, missing_ok, timeout)
+        yield from self._roles_configured_delete(None, rolename, database_id, missing_ok, timeout)
+        yield from self._roles_delete(database_id, None, rolename, missing_ok, timeout)
+
+    def _collaborators_get_id(
+            self,
+            collaborator_id: int | None,
+            user_id: int | None,
+            username: str | None,
+            database_id: int | None,
+            timeout: Timeout
+    ) -> Steps:
+        if user_id is not None or username is not None:
+            user_id = yield from self._users_get_id(user_id, username, timeout)
+            collaborators = yield partial(self._lookup, "collaborators", database_id, timeout)
+            info = collaborators.by_name(user_id)
+            if info is None:
+                raise DoesNotExist("Collaborator matching query does not exist.")
+            if collaborator_id is None or collaborator_id == info["id"]:
+                return info["id"]
+            else:
+                raise ValueError(f"Collaborator ID of {username or user_id} is not {collaborator_id}")
+        elif collaborator_id is not None:
+            return collaborator_id
+        else:
+            raise TypeError("Missing either collaborator_id or user_id or username")
+
+    def _collaborators_get(
+            self,
+            collaborator_id: int | None,
+            user_id: int | None,
+            username: str | None,
+            database_id: int | None,
+            timeout: Timeout
+    ) -> Steps:
+        if username is not None:
+            user_id = yield from self._users_get_id(user_id, username, timeout)
+        if collaborator_id is None and user_id is None:
+            raise TypeError("Missing either collaborator_id or user_id or username")
+        collaborators = yield partial(self._lookup, "collaborators", database_id, timeout)
+        if user_id is not None:
+            info = collaborators.by_name(user_id)
+            if info is not None:
+                if collaborator_id is None or collaborator_id == info["id"]:
+                    return info
+                else:
+                    raise ValueError(f"Collaborator ID of {username or user_id} is not {collaborator_id}")
+        if collaborator_id is not None:
+            info = collaborators.by_id(collaborator_id)
+            if info is not None:
+                return info
+        raise DoesNotExist("Collaborator matching query does not exist.")
+
+    def _collaborators_add(
+            self,
+            database_id: int,
+            user_id: int | None,
+            username: str | None,
+            configured_role_id: int | None,
+            rolename: str | None,
+            exists_ok: bool,
+            timeout: Timeout
+    ) -> Steps:
+        user_id = yield from self._users_get_id(user_id, username, timeout)
+        configured_role_id = yield from self._roles_configured_get_id(
+            configured_role_id,
+            rolename,
+            database_id,
+            timeout
+        )
+        try:
+            info = yield partial(
+                API.collaborators_add,
+                self,
+                database_id=database_id,
+                user_id=user_id,
+                configured_role_id=configured_role_id,
+                timeout=timeout
+            )
+        except IntegrityError:
+            if exists_ok:
+                return (yield from self._collaborators_get(None, user_id, username, database_id, timeout))
+            else:
+                raise
+        self._update_indexes("collaborators", scopes=(database_id, None), add=info)
+        return info
+
+    def _collaborators_delete(
+            self,
+            collaborator_id: int | None,
+            username: str | None,
+            database_id: int | None,
+            missing_ok: bool,
+            timeout: Timeout
+    ) -> Steps:
+        try:
+            collaborator_id = yield from self._collaborators_get_id(
+                collaborator_id,
+                None,
+                username,
+                database_id,
+                timeout
+            )
+            yield partial(API.collaborators_delete, self, collaborator_id=collaborator_id, timeout=timeout)
+        except DoesNotExist:
+            if not missing_ok:
+                raise
+        else:
+            self._update_indexes("collaborators", remove=collaborator_id)
+
+    def _roles_configured_get_id(
+            self,
+            configured_role_id: int | None,
+            rolename: str | None,
+            server_id: int | None,
+            timeout: Timeout
+    ) -> Steps:
+        if rolename is not None:
+            configured_roles = yield partial(self._lookup, "configured_roles", server_id, timeout)
+            info = configured_roles.by_name(rolename)
+            if info is None:
+                raise DoesNotExist(f"Configured Role matching query does not exist.")
+            if configured_role_id is None or configured_role_id == info["id"]:
+                return info["id"]
+            else:
+                raise ValueError(f"Configured role ID of {rolename} is not {configured_role_id}")
+        elif configured_role_id is not None:
+            return configured_role_id
+        else:
+            raise TypeError("Missing either configured_role_id or configured_role_name")
+
+    def _roles_configured_get(
+            self,
+            configured_role_id: int | None,
+            role_name: str | None,
+            server_id: int | None,
+            timeout: Timeout
+    ) -> Steps:
+        if role_name is None and configured_role_id is None:
+            raise TypeError("Missing either configured_role_id or role_name")
+        configured_roles = yield partial(self._lookup, "configured_roles", server_id, timeout)
+        if role_name is not None:
+            info = configured_roles.by_name(role_name)
+            if info is not None:
+                if configured_role_id is None or configured_role_id == info["id"]:
+                    return info
+                else:
+                    raise ValueError(f"Configured role ID of {role_name} is not {configured_role_id}")
+        if configured_role_id is not None:
+            info = configured_roles.by_id(configured_role_id)
+            if info is not None:
+                return info
+        if role_name is not None:
+            raise UndefinedObject(f"Configured role with name {role_name} does not exist")
+        else:
+            raise UndefinedObject(f"Configured role with OID {configured_role_id} does not exist")
+
+    def _roles_configured_add(
+            self,
+            server_id: int,
+            name: str,
+            password: str,
+            exists_ok: bool,
+            timeout: Timeout
+    ) -> Steps:
+        try:
+            info = yield partial(
+                API.roles_configured_add,
+                self,
+                server_id=server_id,
+                name=name,
+                password=password,
+                timeout=timeout
+            )
+        except IntegrityError:
+            if exists_ok:
+                return (yield from self._roles_configured_get(None, name, server_id, timeout))
+            else:
+                raise
+        self._update_indexes("configured_roles", scopes=(server_id, None), add=info)
+        return info
+
+    def _roles_configured_delete(
+            self,
+            configured_role_id: int | None,
+            rolename: str | None,
+            server_id: int | None,
+            missing_ok: bool,
+            timeout: Timeout
+    ) -> Steps:
+        try:
+            configured_role_id = yield from self._roles_configured_get_id(
+                configured_role_id,
+                rolename,
+                server_id,
+                timeout
+            )
+            yield partial(API.roles_configured_delete, self, configured_role_id=configured_role_id, timeout=timeout)
+        except DoesNotExist:
+            if not missing_ok:
+                raise
+        else:
+            self._update_indexes("configured_roles", remove=configured_role_id)
+
+    def _roles_get_oid(
+            self,
+            role_oid: int | None,
+            rolename: str | None,
+            database_id: int | None,
+            timeout: Timeout
+    ) -> Steps:
+        if rolename is not None:
+            roles = yield partial(self._lookup, "roles", database_id, timeout)
+            info = roles.by_name(rolename)
+            if info is None:
+                raise UndefinedObject(f"Role with name {rolename} does not exist")
+            if role_oid is None or role_oid == info["oid"]:
+                return info["oid"]
+            else:
+                raise ValueError(f"Role OID of {rolename} is not {role_oid}")
+        elif role_oid is not None:
+            return role_oid
+        else:
+            raise TypeError("Missing either role_oid or role_name")
+
+    def _roles_get(self, database_id: int, role_oid: int | None, rolename: str | None, timeout: Timeout) -> Steps:
+        if rolename is None and role_oid is None:
+            raise TypeError("Missing either role_oid or role_name")
+        roles = yield partial(self._lookup, "roles", database_id, timeout)
+        found = None
+        if rolename is not None:
+            found = roles.by_name(rolename)
+            if found is not None and role_oid is not None and role_oid != found["oid"]:
+                raise ValueError(f"Role OID of {rolename} is not {role_oid}")
+        if found is None and role_oid is not None:
+            found = roles.by_id(role_oid)
+        if found is not None:
+            found["members"] = found["members"] or []
+            return found
+        if rolename is not None:
+            raise UndefinedObject(f"Role with name {rolename} does not exist")
+        else:
+            raise UndefinedObject(f"Role with OID {role_oid} does not exist")
+
+    def _roles_add(
+            self,
+            rolename: str,
+            database_id: int,
+            password: str | None,
+            login: bool | None,
+            exists_ok: bool,
+            timeout: Timeout
+    ) -> Steps:
+        try:
+            info = yield partial(
+                API.roles_add,
+                self,
+                rolename=rolename,
+                database_id=database_id,
+                password=password,
+                login=login,
+                timeout=timeout
+            )
+        except DuplicateObject:
+            if exists_ok:
+                return (yield from self._roles_get(database_id, None, rolename, timeout))
+            else:
+                raise
+        self._update_indexes("roles", scopes=(database_id,), add=info)
+        return info
+
+    def _roles_delete(
+            self,
+            database_id: int,
+            role_oid: int | None,
+            rolename: str | None,
+            missing_ok: bool,
+            timeout: Timeout
+    ) -> Steps:
+        try:
+            role_oid = yield from self._roles_get_oid(role_oid, rolename, database_id, timeout)
+            yield partial(API.roles_delete, self, database_id=database_id, role_oid=role_oid, timeout=timeout)
+        except UndefinedObject:
+            if not missing_ok:
+                raise
+        else:
+            self._update_indexes("roles", scopes=(database_id,), remove=role_oid)
+
+    def _roles_append_member(
+            self,
+            database_id: int,
+            parent_rolename: str | None,
+            parent_role_oid: int | None,
+            rolename: str | None,
+            role_oid: int | None,
+            timeout: Timeout
+    ) -> Steps:
+        role_oid = yield from self._roles_get_oid(role_oid, rolename, database_id, timeout)
+        parent_info = yield from self._roles_get(database_id, parent_role_oid, parent_rolename, timeout)
+        members = [item["oid"] for item in parent_info["members"]]
+        yield partial(
+            API.roles_set_members,
+            self,
+            parent_role_oid=parent_info["oid"],
+            members=[*members, role_oid],
+            database_id=database_id,
+            timeout=timeout
+        )
+        self._update_indexes("roles", scopes=(database_id,), invalidate=True)
@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+from collections import deque
+
+
+class Limiter:
+    """
+    Rate and concurrency limits for the requests of a method namespace.
+
+    With `rate` at most that many calls per second are sent, in bursts of
+    up to `burst` calls. With `concurrency` at most that many requests are
+    in flight at once; the limit is adjusted AIMD style, shrinking by
+    `decrease` (at most once per `cooldown` seconds) when a request fails
+    or takes longer than `latency_target`, and growing back by one per
+    limit's worth of successful requests, between `min_concurrency` and
+    `max_concurrency`.
+
+    A limiter can be shared by several clients, threads and event loops.
+    """
+
+    def __init__(
+            self,
+            rate: float = None,
+            burst: float = None,
+            concurrency: int = None,
+            min_concurrency: int = 1,
+            max_concurrency: int = None,
+            latency_target: float = None,
+            decrease: float = 0.5,
+            cooldown: float = 1.0
+    ):
+        self._rate = rate
+        self._burst = burst if burst is not None else max(rate or 0, 1)
+        self._tokens = self._burst
+        self._refilled = time.monotonic()
+        self._limit = float(concurrency) if concurrency else None
+        self._min = min_concurrency
+        self._max = max_concurrency or concurrency
+        self._latency_target = latency_target
+        self._decrease = decrease
+        self._cooldown = cooldown
+        self._decreased = float("-inf")
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+    @property
+    def concurrency(self) -> int | None:
+        return None if self._limit is None else int(self._limit)
+
+    def _reserve(self, count: int, timeout: float = None) -> float | None:
+        # Take the tokens, possibly into debt, and return how long to wait for them,
+        # or leave them and return None if that is longer than timeout
+        if self._rate is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled) * self._rate)
+            self._refilled = now
+            delay = max((count - self._tokens) / self._rate, 0.0)
+            if timeout is not None and delay > timeout:
+                return None
+            self._tokens -= count
+            return delay
+
+    def acquire(self, count: int = 1, timeout: float = None) -> bool:
+        """
+        Wait for `count` rate tokens and a concurrency slot, and return
+        whether they were acquired within `timeout` seconds.
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        delay = self._reserve(count, timeout)
+        if delay is None:
+            return False
+        if delay:
+            time.sleep(delay)
+        if self._limit is None:
+            return True
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                if end is None:
+                    self._condition.wait()
+                elif not self._condition.wait(end - time.monotonic()):
+                    # A wakeup may have been meant for this thread, pass it on
+                    self._wake()
+                    if self._in_flight >= int(self._limit):
+                        return False
+            self._in_flight += 1
+            return True
+
+    async def acquire_async(self, count: int = 1, timeout: float = None) -> bool:
+        """
+        Like `acquire`, without blocking the event loop.
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        delay = self._reserve(count, timeout)
+        if delay is None:
+            return False
+        if delay:
+            await asyncio.sleep(delay)
+        if self._limit is None:
+            return True
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return True
+                future = loop.create_future()
+                self._waiters.append((loop, future))
+            try:
+                await asyncio.wait_for(future, None if end is None else end - time.monotonic())
+            except (asyncio.CancelledError, asyncio.TimeoutError) as exc:
+                # The slot may have been handed to this waiter, pass it on
+                with self._lock:
+                    self._wake()
+                if isinstance(exc, asyncio.CancelledError):
+                    raise
+                return False
+
+    def release(self, latency: float | None, failed: bool = False):
+        """
+        Free the slot of a request which took `latency` seconds, or of one
+        which was never sent when `latency` is None.
+        """
+        if self._limit is None:
+            return
+        with self._lock:
+            self._in_flight -= 1
+            if latency is None:
+                # Not sent, so nothing learned about the server
+                pass
+            elif failed or self._latency_target is not None and latency > self._latency_target:
+                now = time.monotonic()
+                if now - self._decreased >= self._cooldown:
+                    self._limit = max(self._min, self._limit * self._decrease)
+                    self._decreased = now
+            else:
+                self._limit = min(self._max, self._limit + 1 / self._limit)
+            self._wake()
+
+    def _wake(self):
+        free = int(self._limit) - self._in_flight
+        if free <= 0:
+            return
+        self._condition.notify(free)
+        while free > 0 and self._waiters:
+            loop, future = self._waiters.popleft()
+            if future.done():
+                # Cancelled while waiting
+                continue
+            loop.call_soon_threadsafe(_set_done, future)
+            free -= 1
+
+
+def _set_done(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
@@ -1,21 +1,58 @@
-from typing import Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
+from itertools import chain, islice
+import contextvars
+import json
+import os
+import threading
+from typing import Any, BinaryIO, Callable, Iterator, Iterable
 
 from .api import API
+from .batch import resolve
+from .cache import TTLCache
+from .columnar import ColumnarResult, decode_pages, typecode
+from .dataframe import FrameBuilder
+from .deadlines import Timeout
+from .export import Format, write_rows
+from .helpers import Helpers, _iter_records, metadata_kinds, run
+from .metadata import Index, Scan
 from .classes import SearchParam, RecordList, RecordAdded, UserDef, UserInfo, RoleInfo, ConfiguredRoleInfo, \
-    CollaboratorInfo
-from .exceptions import DuplicateObject, IntegrityError, UndefinedObject, DoesNotExist
+    CollaboratorInfo, OrderBy, Filter, ColumnInfo, FilterAttnum, FilterLiteral, ExplorationDef, ExplorationResult
+from .exceptions import DuplicateObject, IntegrityError
 
 
 class Columns:
-    def __init__(self, mathesar: API, /, table_oid: int, database_id: int):
+    def __init__(self, mathesar: API, /, table_oid: int, database_id: int, timeout: Timeout = None):
+        self._set_info(resolve(mathesar.columns_list(
+            table_oid=table_oid,
+            database_id=database_id,
+            timeout=timeout
+        )))
+
+    def _set_info(self, info: list[ColumnInfo]):
+        self.info = info
         self._columns: dict[str, int] = {
             col["name"]: col["id"]
-            for col in mathesar.columns_list(
-                table_oid=table_oid,
-                database_id=database_id
-            )
+            for col in info
         }
 
+    @property
+    def primary_key(self) -> list[int]:
+        return [col["id"] for col in self.info if col["primary_key"]]
+
+    def translate(self, record: dict[str | int, Any]) -> dict[int, Any]:
+        return {
+            self[key]: value
+            for key, value in record.items()
+        }
+
+    def select(self, columns: list[str | int] = None) -> list[ColumnInfo]:
+        if columns is None:
+            return list(self.info)
+        info = {col["id"]: col for col in self.info}
+        return [info[self[column]] for column in columns]
+
     def __getitem__(self, item: str | int) -> int:
         if isinstance(item, str):
             return self._columns[item]
@@ -25,7 +62,280 @@ class Columns:
             raise TypeError
 
 
-class Mathesar(API):
+def _combine(operator: str, filters: list[Filter]) -> Filter:
+    # Balanced, so that conditions over many values stay shallow
+    if len(filters) == 1:
+        return filters[0]
+    middle = len(filters) // 2
+    return Filter(
+        type=operator,
+        args=[_combine(operator, filters[:middle]), _combine(operator, filters[middle:])]
+    )
+
+
+def _and(*filters: Filter) -> Filter:
+    return _combine("and", list(filters))
+
+
+def _or(*filters: Filter) -> Filter:
+    return _combine("or", list(filters))
+
+
+def _compare(operator: str, attnum: int, value: Any) -> Filter:
+    return Filter(
+        type=operator,
+        args=[
+            FilterAttnum(type="attnum", value=attnum),
+            FilterLiteral(type="literal", value=value)
+        ]
+    )
+
+
+def _submit(executor: ThreadPoolExecutor, function: Callable, *args) -> Future:
+    # Workers run in a copy of the caller's context, so that its deadline applies to them
+    return executor.submit(contextvars.copy_context().run, function, *args)
+
+
+def _take(iterator: Iterator, n: int) -> list:
+    return [item for _, item in zip(range(n), iterator)]
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[list]:
+    items = iter(items)
+    return iter(lambda: list(islice(items, size)), [])
+
+
+def _map_chunks(function: Callable[[list], list], items: Iterable, chunk_size: int, workers: int) -> list:
+    # At most two chunks per worker are read from `items` ahead of time
+    chunks = _chunks(items, chunk_size)
+    if workers <= 1:
+        return [item for chunk in chunks for item in function(chunk)]
+    results = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(_submit(executor, function, chunk) for chunk in _take(chunks, 2 * workers))
+        while pending:
+            results.extend(pending.popleft().result())
+            pending.extend(_submit(executor, function, chunk) for chunk in _take(chunks, 1))
+    return results
+
+
+def _outcome(item: Any) -> Any:
+    if isinstance(item, Future):
+        return item.exception() or item.result()
+    return item
+
+
+def _in_filter(key: list[int], values: Iterable[tuple]) -> Filter:
+    # `key IN values`, as a disjunction of equalities
+    return _or(*(
+        _and(*(
+            _compare("equal", attnum, value)
+            for attnum, value in zip(key, item)
+        ))
+        for item in values
+    ))
+
+
+def _seek_filter(key: list[int], after: tuple) -> Filter:
+    # Lexicographic `key > after`: (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...
+    return _or(*(
+        _and(*(
+            _compare("equal", attnum, value)
+            for attnum, value in zip(key[:i], after[:i])
+        ), _compare("greater", key[i], after[i]))
+        for i in range(len(key))
+    ))
+
+
+_missing = object()
+
+_schema_methods = {
+    "columns.add",
+    "columns.add_primary_key_column",
+    "columns.delete",
+    "columns.patch",
+    "tables.delete",
+}
+
+default_cache_ttls = {
+    "records.get": 5,
+    "records.list": 5,
+    "records.list_summaries": 5,
+    "tables.get": 60,
+    "columns.list": 60,
+}
+
+
+def _is_read(method: str) -> bool:
+    return method.rsplit(".", 1)[-1].startswith(("list", "get", "search", "run")) \
+        or method == "data_modeling.suggest_types"
+
+
+def _cache_key(method: str, params: dict[str, Any]) -> tuple:
+    return (
+        params.get("database_id"),
+        params.get("table_oid"),
+        method,
+        json.dumps(params, sort_keys=True, default=repr)
+    )
+
+
+def _completed(value: Any) -> Future:
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class Mathesar(API, Helpers):
+    """
+    Client for the Mathesar API with convenience wrappers.
+
+    With `read_cache` the results of `records.get`, `records.list`,
+    `records.list_summaries`, `tables.get` and `columns.list` are cached,
+    keyed on their parameters, for the TTLs of `default_cache_ttls` or of
+    the dict passed instead, keeping at most `cache_size` results. Writes
+    made through this client drop the cached results of the table they
+    touch. Cached results are shared between callers and must not be
+    modified.
+
+    With `metadata_cache` the users, roles, configured roles and
+    collaborators used by the lookup helpers are indexed by id and name
+    and kept until `metadata_ttl` expires or `invalidate_metadata` is
+    called, instead of being listed on every lookup. Adds and deletes made
+    through this client update them in place.
+    """
+
+    def __init__(
+            self,
+            url: str, /,
+            columns_ttl: float = 60,
+            read_cache: bool | dict[str, float] = False,
+            cache_size: int = 1024,
+            metadata_cache: bool = False,
+            metadata_ttl: float = None,
+            **kwargs
+    ):
+        super().__init__(url, **kwargs)
+        self._columns_cache = TTLCache(ttl=columns_ttl)
+        self._metadata_cache = metadata_cache
+        self._metadata_ttl = metadata_ttl
+        self._indexes: dict[tuple[str, Any], Index] = {}
+        self._indexes_lock = threading.Lock()
+        if read_cache is True:
+            read_cache = default_cache_ttls
+        self._cache_ttls: dict[str, float] = read_cache or {}
+        self._read_cache = TTLCache(max_size=cache_size)
+
+    def request(self, method: str, params: dict[str, Any], timeout: Timeout = None):
+        ttl = self._cache_ttls.get(method)
+        if ttl is not None:
+            key = _cache_key(method, params)
+            cached = self._read_cache.get(key, _missing)
+            if cached is not _missing:
+                return _completed(cached) if getattr(self._local, "batch", None) is not None else cached
+        result = super().request(method, params, timeout)
+        if ttl is not None:
+            if isinstance(result, Future):
+                result.add_done_callback(
+                    lambda future: future.cancelled() or future.exception() is not None
+                                   or self._read_cache.set(key, future.result(), ttl=ttl)
+                )
+            else:
+                self._read_cache.set(key, result, ttl=ttl)
+        elif not _is_read(method):
+            self._invalidate(method, params)
+            if isinstance(result, Future):
+                result.add_done_callback(lambda _: self._invalidate(method, params))
+        return result
+
+    def _invalidate(self, method: str, params: dict[str, Any]):
+        database_id = params.get("database_id")
+        table_oid = None if method.startswith("data_modeling.") else params.get("table_oid")
+        if method in _schema_methods or method.startswith("data_modeling."):
+            self.invalidate_columns(table_oid=table_oid, database_id=database_id)
+        if self._cache_ttls and (table_oid is not None or method.startswith("data_modeling.")):
+            self.invalidate_cache(table_oid=table_oid, database_id=database_id)
+
+    def _index(self, kind: str, scope: Any = None) -> Index:
+        with self._indexes_lock:
+            index = self._indexes.get((kind, scope))
+            if index is None:
+                if kind not in metadata_kinds:
+                    raise ValueError(f"Unknown metadata {kind}")
+                _, _, id_key, name_key = metadata_kinds[kind]
+                index = Index(self._list_call(kind, scope), id_key, name_key, self._metadata_ttl)
+                self._indexes[(kind, scope)] = index
+            return index
+
+    def _lookup(self, kind: str, scope: Any = None, timeout: Timeout = None) -> Index | Scan:
+        if self._metadata_cache:
+            index = self._index(kind, scope)
+            index.load(timeout)
+            return index
+        # Listed on every lookup
+        _, _, id_key, name_key = metadata_kinds[kind]
+        return Scan(resolve(self._list_call(kind, scope)(timeout=timeout)), id_key, name_key)
+
+    def _update_indexes(
+            self,
+            kind: str,
+            scopes: tuple = None,
+            add: Any = None,
+            remove: Any = None,
+            invalidate: bool = False
+    ):
+        with self._indexes_lock:
+            indexes = [
+                index
+                for (index_kind, scope), index in self._indexes.items()
+                if index_kind == kind and (scopes is None or scope in scopes)
+            ]
+        for index in indexes:
+            if invalidate:
+                index.invalidate()
+            if add is not None:
+                index.add(add)
+            if remove is not None:
+                index.remove(remove)
+
+    def invalidate_metadata(self):
+        """
+        Refetch the users, roles, configured roles and collaborators on their
+        next lookup.
+        """
+        with self._indexes_lock:
+            indexes = list(self._indexes.values())
+        for index in indexes:
+            index.invalidate()
+
+    def invalidate_cache(self, /, table_oid: int = None, database_id: int = None, **kwargs):
+        """
+        Drop the cached read results of a table, of a database, or all of
+        them.
+        """
+        self._read_cache.invalidate(
+            lambda key: (database_id is None or key[0] == database_id)
+                        and (table_oid is None or key[1] == table_oid)
+        )
+
+    def get_columns(self, /, table_oid: int, database_id: int, timeout: Timeout = None, **kwargs) -> Columns:
+        """
+        Return the columns of a table, cached per `(database_id, table_oid)`.
+        """
+        return self._columns_cache.get_or_set(
+            (database_id, table_oid),
+            lambda: Columns(self, table_oid=table_oid, database_id=database_id, timeout=timeout)
+        )
+
+    def invalidate_columns(self, /, table_oid: int = None, database_id: int = None, **kwargs):
+        """
+        Drop the cached columns of a table, of a database, or all of them.
+        """
+        self._columns_cache.invalidate(
+            lambda key: (database_id is None or key[0] == database_id)
+                        and (table_oid is None or key[1] == table_oid)
+        )
+
     def records_search(
             self, /,
             table_oid: int,
@@ -35,119 +345,771 @@ class Mathesar(API):
             limit: int = 10,
             offset: int = 0,
             return_record_summaries: bool = False,
+            timeout: Timeout = None,
             **kwargs
     ) -> RecordList:
-        if search_literals is not None:
-            columns = Columns(self, table_oid=table_oid, database_id=database_id)
-            search_params = list(search_params)
-            search_params.extend(
-                SearchParam(
-                    attnum=columns[name],
-                    literal=value
-                )
-                for name, value in search_literals.items()
-            )
+        search_params = run(self._search_params(table_oid, database_id, search_params, search_literals, timeout))
         return super().records_search(
             table_oid=table_oid,
             database_id=database_id,
             search_params=search_params,
             limit=limit,
             offset=offset,
-            return_record_summaries=return_record_summaries
+            return_record_summaries=return_record_summaries,
+            timeout=timeout
         )
 
+    def iter_record_pages(
+            self, /,
+            table_oid: int,
+            database_id: int,
+            order: list[OrderBy] = None,
+            filter: Filter = None,
+            page_size: int = 500,
+            return_record_summaries: bool = False,
+            prefetch: bool = True,
+            keyset: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> Iterator[RecordList]:
+        """
+        Iterate over the pages of `records_list`.
+
+        While a page is being consumed the next one is fetched in the
+        background, so at most two pages are held in memory.
+
+        With `keyset` the pages are ordered by primary key and each one is
+        selected with `pk > last seen pk` instead of an offset, which keeps
+        the cost of every page constant on the server. `order` cannot be
+        combined with it.
+        """
+        if keyset:
+            if order is not None:
+                raise ValueError("order cannot be used with keyset pagination")
+            key = self.get_columns(table_oid=table_oid, database_id=database_id, timeout=timeout).primary_key
+            if not key:
+                raise ValueError(f"Table {table_oid} has no primary key")
+            order = [OrderBy(attnum=attnum, direction="asc") for attnum in key]
+
+        def fetch(cursor) -> RecordList:
+            if keyset:
+                page_filter = filter
+                if cursor is not None:
+                    seek = _seek_filter(key, cursor)
+                    page_filter = seek if filter is None else _and(filter, seek)
+                offset = None
+            else:
+                page_filter = filter
+                offset = cursor
+            return resolve(self.records_list(
+                table_oid=table_oid,
+                database_id=database_id,
+                limit=page_size,
+                offset=offset,
+                order=order,
+                filter=page_filter,
+                return_record_summaries=return_record_summaries,
+                timeout=timeout
+            ))
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            cursor = None if keyset else 0
+            page = fetch(cursor)
+            while True:
+                results = page["results"]
+                last = len(results) < page_size
+                if keyset:
+                    if results:
+                        cursor = tuple(results[-1][str(attnum)] for attnum in key)
+                else:
+                    cursor += len(results)
+                    last = last or cursor >= page["count"]
+                following = None
+                if not last and executor is not None:
+                    following = _submit(executor, fetch, cursor)
+                yield page
+                if last:
+                    break
+                page = following.result() if following is not None else fetch(cursor)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    def iter_records(
+            self, /,
+            table_oid: int,
+            database_id: int,
+            order: list[OrderBy] = None,
+            filter: Filter = None,
+            page_size: int = 500,
+            prefetch: bool = True,
+            keyset: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> Iterator[dict]:
+        """
+        Lazily iterate over the records of a table, page by page.
+        """
+        for page in self.iter_record_pages(
+                table_oid=table_oid,
+                database_id=database_id,
+                order=order,
+                filter=filter,
+                page_size=page_size,
+                prefetch=prefetch,
+                keyset=keyset,
+                timeout=timeout
+        ):
+            yield from page["results"]
+
+    def fetch_all_records(
+            self, /,
+            table_oid: int,
+            database_id: int,
+            order: list[OrderBy] = None,
+            filter: Filter = None,
+            page_size: int = 500,
+            workers: int = 4,
+            ordered: bool = True,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> Iterator[dict]:
+        """
+        Fetch every record of a table, requesting pages concurrently.
+
+        The first page tells the total count, then the remaining offsets are
+        fetched by `workers` threads with at most two pages per worker in
+        flight. Records are yielded in table order unless `ordered` is False,
+        in which case pages are yielded as soon as they arrive.
+        """
+        def fetch(offset: int) -> RecordList:
+            return resolve(self.records_list(
+                table_oid=table_oid,
+                database_id=database_id,
+                limit=page_size,
+                offset=offset,
+                order=order,
+                filter=filter,
+                timeout=timeout
+            ))
+
+        first = fetch(0)
+        offsets = iter(range(page_size, first["count"], page_size))
+        window = 2 * workers
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            # The first window is in flight while the first page is consumed
+            if ordered:
+                pending = deque(_submit(executor, fetch, offset) for offset in _take(offsets, window))
+                yield from first["results"]
+                while pending:
+                    page = pending.popleft().result()
+                    pending.extend(_submit(executor, fetch, offset) for offset in _take(offsets, 1))
+                    yield from page["results"]
+            else:
+                pending = {_submit(executor, fetch, offset) for offset in _take(offsets, window)}
+                yield from first["results"]
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    pending.update(_submit(executor, fetch, offset) for offset in _take(offsets, len(done)))
+                    for future in done:
+                        yield from future.result()["results"]
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def iter_exploration_pages(
+            self, /,
+            exploration_id: int = None,
+            exploration_def: ExplorationDef = None,
+            page_size: int = 500,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> Iterator[ExplorationResult]:
+        """
+        Iterate over the pages of a saved exploration, or of an unsaved one
+        given by `exploration_def`.
+        """
+        if exploration_id is None and exploration_def is None:
+            raise TypeError("Missing either exploration_id or exploration_def")
+
+        def run(offset: int) -> ExplorationResult:
+            if exploration_id is not None:
+                return resolve(self.explorations_run_saved(
+                    exploration_id=exploration_id,
+                    limit=page_size,
+                    offset=offset,
+                    timeout=timeout
+                ))
+            return resolve(self.explorations_run(
+                exploration_def=exploration_def,
+                limit=page_size,
+                offset=offset,
+                timeout=timeout
+            ))
+
+        offset = 0
+        while True:
+            page = run(offset)
+            yield page
+            results = page["records"]["results"]
+            offset += len(results)
+            if len(results) < page_size or offset >= page["records"].get("count", offset + 1):
+                break
+
+    def records_list_columnar(
+            self, /,
+            table_oid: int,
+            database_id: int,
+            columns: list[str | int] = None,
+            order: list[OrderBy] = None,
+            filter: Filter = None,
+            page_size: int = 500,
+            keyset: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> ColumnarResult:
+        """
+        Fetch the records of a table as one array per column, keyed by
+        column name.
+
+        Each page is decoded into the column buffers and then dropped.
+        Columns are typed from `columns_list`: integers, floats and booleans
+        become NumPy arrays when NumPy is installed or `array.array`
+        otherwise, other types are kept as Python objects.
+        """
+        selected = self.get_columns(table_oid=table_oid, database_id=database_id, timeout=timeout).select(columns)
+        pages = (
+            page["results"]
+            for page in self.iter_record_pages(
+                table_oid=table_oid,
+                database_id=database_id,
+                order=order,
+                filter=filter,
+                page_size=page_size,
+                keyset=keyset,
+                timeout=timeout
+            )
+        )
+        return decode_pages(
+            pages,
+            keys={col["name"]: str(col["id"]) for col in selected},
+            types={col["name"]: typecode(col) for col in selected}
+        )
+
+    def records_to_dataframe(
+            self, /,
+            table_oid: int,
+            database_id: int,
+            columns: list[str | int] = None,
+            order: list[OrderBy] = None,
+            filter: Filter = None,
+            page_size: int = 1000,
+            keyset: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> "pandas.DataFrame":
+        """
+        Fetch the records of a table into a pandas DataFrame with one column
+        per table column, named after it.
+
+        The dtypes are chosen from the column types before fetching and the
+        pages are written into buffers sized from the record count, so the
+        data is copied once.
+        """
+        selected = self.get_columns(table_oid=table_oid, database_id=database_id, timeout=timeout).select(columns)
+        builder = None
+        for page in self.iter_record_pages(
+                table_oid=table_oid,
+                database_id=database_id,
+                order=order,
+                filter=filter,
+                page_size=page_size,
+                keyset=keyset,
+                timeout=timeout
+        ):
+            if builder is None:
+                builder = FrameBuilder(selected, page["count"])
+            builder.add(page["results"])
+        return builder.build()
+
+    def explorations_run_columnar(
+            self, /,
+            exploration_id: int = None,
+            exploration_def: ExplorationDef = None,
+            page_size: int = 500,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> ColumnarResult:
+        """
+        Run an exploration and return its output as one array per column,
+        keyed by column alias.
+        """
+        pages = self.iter_exploration_pages(
+            exploration_id=exploration_id,
+            exploration_def=exploration_def,
+            page_size=page_size,
+            timeout=timeout
+        )
+        first = next(pages)
+        metadata = first["column_metadata"] or {}
+        aliases = list(first["output_columns"])
+        return decode_pages(
+            (
+                page["records"]["results"]
+                for page in chain([first], pages)
+            ),
+            keys={alias: alias for alias in aliases},
+            types={alias: typecode(metadata.get(alias) or {}) for alias in aliases}
+        )
+
+    def records_export(
+            self, /,
+            target: str | os.PathLike | BinaryIO,
+            table_oid: int,
+            database_id: int,
+            format: Format = "csv",
+            compress: bool = None,
+            columns: list[str | int] = None,
+            order: list[OrderBy] = None,
+            filter: Filter = None,
+            page_size: int = 1000,
+            keyset: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> int:
+        """
+        Stream the records of a table to a CSV or JSON Lines file, with
+        columns named after the table columns, and return the number of
+        records written. See `export.write_rows`.
+        """
+        selected = self.get_columns(table_oid=table_oid, database_id=database_id, timeout=timeout).select(columns)
+        pages = (
+            page["results"]
+            for page in self.iter_record_pages(
+                table_oid=table_oid,
+                database_id=database_id,
+                order=order,
+                filter=filter,
+                page_size=page_size,
+                keyset=keyset,
+                timeout=timeout
+            )
+        )
+        return write_rows(
+            target,
+            pages,
+            keys={col["name"]: str(col["id"]) for col in selected},
+            format=format,
+            compress=compress,
+            codec=self._codec
+        )
+
+    def explorations_export(
+            self, /,
+            target: str | os.PathLike | BinaryIO,
+            exploration_id: int = None,
+            exploration_def: ExplorationDef = None,
+            format: Format = "csv",
+            compress: bool = None,
+            page_size: int = 1000,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> int:
+        """
+        Stream the output of an exploration to a CSV or JSON Lines file, with
+        columns named after the output column aliases, and return the number
+        of rows written. See `export.write_rows`.
+        """
+        pages = self.iter_exploration_pages(
+            exploration_id=exploration_id,
+            exploration_def=exploration_def,
+            page_size=page_size,
+            timeout=timeout
+        )
+        first = next(pages)
+        return write_rows(
+            target,
+            (page["records"]["results"] for page in chain([first], pages)),
+            keys={alias: alias for alias in first["output_columns"]},
+            format=format,
+            compress=compress,
+            codec=self._codec
+        )
+
+    def records_get_many(
+            self, /,
+            record_ids: Iterable[Any],
+            table_oid: int,
+            database_id: int,
+            chunk_size: int = 100,
+            workers: int = 1,
+            return_record_summaries: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> dict[Any, RecordList]:
+        """
+        Get many records by primary key, with one `records_list` call per
+        chunk of `chunk_size` ids.
+
+        The result maps each id found to a `RecordList` holding its record,
+        like `records_get` returns, with the record summaries of the chunk.
+        """
+        primary_key = self.get_columns(table_oid=table_oid, database_id=database_id, timeout=timeout).primary_key
+        if len(primary_key) != 1:
+            raise ValueError(f"Table {table_oid} has no single column primary key")
+        id_col = str(primary_key[0])
+
+        def get_chunk(chunk: list[Any]) -> list[tuple[Any, RecordList]]:
+            page = resolve(self.records_list(
+                table_oid=table_oid,
+                database_id=database_id,
+                limit=len(chunk),
+                filter=_in_filter(primary_key, [(record_id,) for record_id in chunk]),
+                return_record_summaries=return_record_summaries,
+                timeout=timeout
+            ))
+            record_summaries = page.get("record_summaries") or {}
+            return [
+                (record[id_col], self._result("records.get", RecordList(
+                    count=1,
+                    results=[record],
+                    grouping=None,
+                    linked_record_summaries=page.get("linked_record_summaries"),
+                    record_summaries={
+                        key: value
+                        for key, value in record_summaries.items()
+                        if key == str(record[id_col])
+                    }
+                )))
+                for record in page["results"]
+            ]
+
+        return dict(_map_chunks(get_chunk, dict.fromkeys(record_ids), chunk_size, workers))
+
     def records_add(
             self, /,
             record_def: dict[str | int, Any],
             table_oid: int,
             database_id: int,
             return_record_summaries: bool = False,
+            timeout: Timeout = None,
             **kwargs
     ) -> RecordAdded:
-        columns = Columns(self, table_oid=table_oid, database_id=database_id)
-        record_def = {
-            columns[key]: value
-            for key, value in record_def.items()
-        }
         return super().records_add(
             database_id=database_id,
             table_oid=table_oid,
-            record_def=record_def
+            record_def=run(self._record_def(record_def, table_oid, database_id, timeout)),
+            return_record_summaries=return_record_summaries,
+            timeout=timeout
         )
 
+    def records_add_many(
+            self, /,
+            records: Iterable[dict[str | int, Any]],
+            table_oid: int,
+            database_id: int,
+            chunk_size: int = 100,
+            workers: int = 1,
+            return_record_summaries: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> list[RecordAdded | Exception]:
+        """
+        Add many records, sending each chunk of `chunk_size` records as one
+        JSON-RPC batch and up to `workers` chunks concurrently.
+
+        Column names are resolved once. The result has one item per record:
+        the added record, or the exception raised while adding it.
+        """
+        columns = self.get_columns(table_oid=table_oid, database_id=database_id, timeout=timeout)
+
+        def add_chunk(chunk: list[dict[str | int, Any]]) -> list[RecordAdded | Exception]:
+            calls = []
+            for record in chunk:
+                try:
+                    record_def = columns.translate(record)
+                except (KeyError, TypeError) as exc:
+                    calls.append(exc)
+                    continue
+                calls.append(partial(
+                    API.records_add,
+                    self,
+                    record_def=record_def,
+                    table_oid=table_oid,
+                    database_id=database_id,
+                    return_record_summaries=return_record_summaries
+                ))
+            return self._send_batch(calls, max_size=chunk_size, timeout=timeout)
+
+        return _map_chunks(add_chunk, records, chunk_size, workers)
+
+    def records_upsert_many(
+            self, /,
+            records: Iterable[dict[str | int, Any]],
+            key_columns: list[str | int],
+            table_oid: int,
+            database_id: int,
+            chunk_size: int = 100,
+            workers: int = 1,
+            return_record_summaries: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> list[RecordAdded | None | Exception]:
+        """
+        Insert or update many records, matching them to the existing ones on
+        `key_columns`.
+
+        For each chunk the matching records are fetched with one
+        `records_list` call, then the missing records are added and the
+        changed ones patched in one JSON-RPC batch. The result has one item
+        per record: the added or patched record, None if the record was
+        already up to date, or the exception raised for it.
+
+        Records of a chunk with the same key are merged, later values
+        winning, and share the outcome of a single add or patch. As chunks
+        may be upserted concurrently, a key repeated in a later chunk fails
+        with a ValueError. Key values are matched as they are returned by
+        the server, so they must compare equal to them: pass `1`, not `"1"`,
+        for an integer column.
+        """
+        columns = self.get_columns(table_oid=table_oid, database_id=database_id, timeout=timeout)
+        key = [columns[column] for column in key_columns]
+        if len(columns.primary_key) != 1:
+            raise ValueError(f"Table {table_oid} has no single column primary key")
+        id_col = str(columns.primary_key[0])
+
+        def rows() -> Iterator[tuple[dict[int, Any], tuple] | Exception]:
+            # Read in order by _map_chunks, so the first chunk with a key keeps it
+            chunk_of_key = {}
+            for position, record in enumerate(records):
+                try:
+                    record_def = columns.translate(record)
+                    value = tuple(record_def[attnum] for attnum in key)
+                except (KeyError, TypeError) as exc:
+                    yield exc
+                    continue
+                if chunk_of_key.setdefault(value, position // chunk_size) != position // chunk_size:
+                    yield ValueError(f"Key {value} is repeated in another chunk")
+                else:
+                    yield record_def, value
+
+        def upsert_chunk(chunk: list[tuple[dict[int, Any], tuple] | Exception]) -> list[RecordAdded | None | Exception]:
+            merged = {}
+            for row in chunk:
+                if not isinstance(row, Exception):
+                    record_def, value = row
+                    merged[value] = {**merged.get(value, {}), **record_def}
+            existing = {}
+            if merged:
+                try:
+                    page = resolve(self.records_list(
+                        table_oid=table_oid,
+                        database_id=database_id,
+                        filter=_in_filter(key, merged),
+                        timeout=timeout
+                    ))
+                except Exception as exc:
+                    return [exc] * len(chunk)
+                for current in page["results"]:
+                    existing.setdefault(tuple(current[str(attnum)] for attnum in key), current)
+            calls = []
+            for value, record_def in merged.items():
+                current = existing.get(value)
+                if current is None:
+                    calls.append(partial(
+                        API.records_add,
+                        self,
+                        record_def=record_def,
+                        table_oid=table_oid,
+                        database_id=database_id,
+                        return_record_summaries=return_record_summaries
+                    ))
+                    continue
+                changes = {
+                    attnum: value
+                    for attnum, value in record_def.items()
+                    if current.get(str(attnum)) != value
+                }
+                calls.append(partial(
+                    API.records_patch,
+                    self,
+                    record_def=changes,
+                    record_id=current[id_col],
+                    table_oid=table_oid,
+                    database_id=database_id,
+                    return_record_summaries=return_record_summaries
+                ) if changes else None)
+            outcomes = dict(zip(merged, self._send_batch(calls, max_size=chunk_size, timeout=timeout)))
+            return [
+                row if isinstance(row, Exception) else outcomes[row[1]]
+                for row in chunk
+            ]
+
+        return _map_chunks(upsert_chunk, rows(), chunk_size, workers)
+
+    def records_patch_many(
+            self, /,
+            patches: Iterable[tuple[Any, dict[str | int, Any]]],
+            table_oid: int,
+            database_id: int,
+            snapshot: RecordList | Iterable[RecordList] | Iterable[dict] = None,
+            fetch_current: bool = False,
+            chunk_size: int = 100,
+            workers: int = 1,
+            return_record_summaries: bool = False,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> list[RecordAdded | None | Exception]:
+        """
+        Patch many records, given as `(record_id, changes)` pairs keyed by
+        column name or attnum, sending each chunk as one JSON-RPC batch.
+
+        Values equal to the ones in `snapshot` (records fetched earlier, in
+        any form accepted by `records_delete`) are not sent, nor are they
+        with `fetch_current`, which fetches the current records of each
+        chunk first. The result has one item per pair: the patched record,
+        None if nothing changed, or the exception raised for it.
+        """
+        columns = self.get_columns(table_oid=table_oid, database_id=database_id, timeout=timeout)
+        primary_key = columns.primary_key
+        if len(primary_key) != 1:
+            raise ValueError(f"Table {table_oid} has no single column primary key")
+        id_col = str(primary_key[0])
+        known = {}
+        if snapshot is not None:
+            known = {record[id_col]: record for record in _iter_records(snapshot)}
+
+        def patch_chunk(chunk: list[tuple[Any, dict[str | int, Any]]]) -> list[RecordAdded | None | Exception]:
+            current = known
+            if fetch_current:
+                try:
+                    page = resolve(self.records_list(
+                        table_oid=table_oid,
+                        database_id=database_id,
+                        limit=len(chunk),
+                        filter=_in_filter(primary_key, {(record_id,) for record_id, _ in chunk}),
+                        timeout=timeout
+                    ))
+                except Exception as exc:
+                    return [exc] * len(chunk)
+                current = {record[id_col]: record for record in page["results"]}
+            calls = []
+            for record_id, changes in chunk:
+                try:
+                    changes = columns.translate(changes)
+                except (KeyError, TypeError) as exc:
+                    calls.append(exc)
+                    continue
+                record = current.get(record_id)
+                if record is not None:
+                    changes = {
+                        attnum: value
+                        for attnum, value in changes.items()
+                        if record.get(str(attnum), _missing) != value
+                    }
+                calls.append(partial(
+                    API.records_patch,
+                    self,
+                    record_def=changes,
+                    record_id=record_id,
+                    table_oid=table_oid,
+                    database_id=database_id,
+                    return_record_summaries=return_record_summaries
+                ) if changes else None)
+            return self._send_batch(calls, max_size=chunk_size, timeout=timeout)
+
+        return _map_chunks(patch_chunk, patches, chunk_size, workers)
+
+    def _send_batch(self, calls: list[Callable[[], Any] | Any], max_size: int, timeout: Timeout = None) -> list[Any]:
+        # Calls are issued in one batch, anything else is passed through as the outcome
+        issued = []
+        try:
+            with self.batch(max_size=max_size, timeout=timeout):
+                for call in calls:
+                    if callable(call):
+                        try:
+                            call = call()
+                        except Exception as exc:
+                            call = exc
+                    issued.append(call)
+        except Exception:
+            # Transport errors are recorded on every future of the batch
+            pass
+        return [_outcome(item) for item in issued]
+
     def records_delete(
             self, /,
             table_oid: int,
             database_id: int,
-            record_ids: list[Any] = (),
-            record_list: RecordList = None,
-            id_col: str = None,
+            record_ids: Iterable[Any] = (),
+            record_list: RecordList | Iterable[RecordList] | Iterable[dict] = None,
+            id_col: str | int = None,
+            chunk_size: int = None,
+            workers: int = 1,
+            progress: Callable[[int], Any] = None,
+            timeout: Timeout = None,
             **kwargs
     ) -> list[Any]:
-        if record_list is not None:
-            columns = Columns(self, table_oid=table_oid, database_id=database_id)
-            id_col = str(columns[id_col])
-            record_ids = list(record_ids)
-            record_ids.extend(
-                record[id_col]
-                for record in record_list
+        """
+        Delete records by primary key, given as `record_ids` or taken from
+        the `id_col` column (the primary key by default) of the records in
+        `record_list`. That can be a `RecordList`, a list of records or an
+        iterator of `RecordList` pages, which is consumed lazily.
+
+        With `chunk_size` the ids are deleted in chunks, up to `workers`
+        chunks at a time, and `progress` is called with the number of
+        records deleted so far after each chunk. When deleting the pages of
+        an iterator over the same table, iterate with `keyset=True` so that
+        the deletions do not shift the pages.
+        """
+        record_ids = run(self._record_ids(record_ids, record_list, id_col, table_oid, database_id, timeout))
+        if chunk_size is None:
+            return super().records_delete(
+                database_id=database_id,
+                table_oid=table_oid,
+                record_ids=list(record_ids),
+                timeout=timeout
             )
-        return super().records_delete(
-            database_id=database_id,
-            table_oid=table_oid,
-            record_ids=record_ids
-        )
 
-    def users_get_id(self, /, user_id: int = None, username: str = None, **kwargs):
-        if username is not None:
-            for info in self.users_list():
-                if info["username"] == username:
-                    if user_id is None or user_id == info["id"]:
-                        return info["id"]
-                    else:
-                        raise ValueError(f"User ID of {username} is not {user_id}")
-            raise DoesNotExist(f"User matching query does not exist.")
-        elif user_id is not None:
-            return user_id
-        else:
-            raise TypeError("Missing either user_id or username")
+        lock = threading.Lock()
+        deleted_count = 0
 
-    def users_get(self, /, user_id: int = None, username: str = None, **kwargs) -> UserInfo:
-        for info in self.users_list():
-            if info["username"] == username:
-                if user_id is None or user_id == info["id"]:
-                    return info
-                else:
-                    raise ValueError(f"Configured role ID of {username} is not {user_id}")
-            elif info["id"] == user_id:
-                return info
-        if username is not None or user_id is not None:
-            raise DoesNotExist("User matching query does not exist.")
-        else:
-            raise TypeError("Missing either configured_role_id or role_name")
+        def delete_chunk(chunk: list[Any]) -> list[Any]:
+            nonlocal deleted_count
+            deleted = resolve(API.records_delete(
+                self,
+                database_id=database_id,
+                table_oid=table_oid,
+                record_ids=chunk,
+                timeout=timeout
+            ))
+            if progress is not None:
+                with lock:
+                    deleted_count += len(deleted)
+                    progress(deleted_count)
+            return deleted
 
-    def users_add(self, /, user_def: UserDef, exists_ok: bool = False, **kwargs) -> UserInfo:
-        try:
-            return super().users_add(user_def=user_def)
-        except IntegrityError:
-            if exists_ok:
-                return self.users_get(username=user_def["username"])
-            else:
-                raise
+        return _map_chunks(delete_chunk, record_ids, chunk_size, workers)
+
+    def users_get_id(self, /, user_id: int = None, username: str = None, timeout: Timeout = None, **kwargs):
+        return run(self._users_get_id(user_id, username, timeout))
+
+    def users_get(self, /, user_id: int = None, username: str = None, timeout: Timeout = None, **kwargs) -> UserInfo:
+        return run(self._users_get(user_id, username, timeout))
+
+    def users_add(self, /, user_def: UserDef, exists_ok: bool = False, timeout: Timeout = None, **kwargs) -> UserInfo:
+        return run(self._users_add(user_def, exists_ok, timeout))
 
     def users_delete(
             self, /,
             user_id: int = None,
             username: str = None,
             missing_ok: bool = False,
+            timeout: Timeout = None,
             **kwargs
     ):
-        try:
-            user_id = self.users_get_id(user_id=user_id, username=username)
-            return super().users_delete(user_id=user_id)
-        except DoesNotExist:
-            if not missing_ok:
-                raise
+        return run(self._users_delete(user_id, username, missing_ok, timeout))
 
     def collaborators_full_add(
             self, /,
@@ -161,46 +1123,192 @@ class Mathesar(API):
             rolename: str = None,
             role_password: str = None,
             exists_ok: bool = True,
+            timeout: Timeout = None,
             **kwargs
     ):
-        rolename = rolename or username
-        role_password = role_password or password
-        self.roles_add(
-            rolename=rolename,
-            database_id=database_id,
-            password=role_password,
-            login=True,
-            exists_ok=exists_ok
-        )
-        configured_role_info = self.roles_configured_add(
-            server_id=database_id,
-            name=rolename,
-            password=role_password,
-            exists_ok=exists_ok
-        )
-        user_def = UserDef(
-            username=username,
-            password=password,
-            is_superuser=is_superuser,
-            email=email,
-            full_name=full_name,
-            display_language=display_language
-        )
-        user_def = UserDef(**{
-            k: v
-            for k, v in user_def.items()
-            if v is not None
-        })
-        user_info = self.users_add(
-            user_def=user_def,
-            exists_ok=exists_ok
-        )
-        return self.collaborators_add(
-            database_id=database_id,
-            user_id=user_info["id"],
-            configured_role_id=configured_role_info["id"],
-            exists_ok=exists_ok
-        )
+        return run(self._collaborators_full_add(
+            username,
+            password,
+            database_id,
+            is_superuser,
+            email,
+            full_name,
+            display_language,
+            rolename,
+            role_password,
+            exists_ok,
+            timeout
+        ))
+
+    def collaborators_full_add_many(
+            self, /,
+            users: Iterable[dict[str, Any]],
+            database_id: int,
+            chunk_size: int = 100,
+            workers: int = 1,
+            timeout: Timeout = None,
+            **kwargs
+    ) -> list[dict[str, Any]]:
+        """
+        Add many collaborators as `collaborators_full_add` does, each given
+        as a dict of its arguments (`username`, `password`, `rolename`...).
+
+        The existing roles, configured roles, users and collaborators are
+        listed once. For each chunk of users the missing roles, configured
+        roles and users are then added in one JSON-RPC batch and the missing
+        collaborators in a second one, with up to `workers` chunks in
+        flight. The result has one report per user, with its `status`
+        ("created", "existing" or "failed"), the kinds of objects `created`
+        for it, its `collaborator` info and the `error` raised, if any. Users
+        missing their `username` or `password` fail with a `KeyError`.
+        """
+        with self.batch(timeout=timeout):
+            listed = [
+                self.roles_list(database_id=database_id),
+                self.roles_configured_list(server_id=database_id),
+                self.users_list(),
+                self.collaborators_list(database_id=database_id),
+            ]
+        roles, configured_roles, existing_users, collaborators = [
+            # The first item wins, as with the lookups of collaborators_full_add
+            {info[key]: info for info in reversed(resolve(items))}
+            for items, key in zip(listed, ("name", "name", "username", "user_id"))
+        ]
+        found = {
+            "role": roles,
+            "configured_role": configured_roles,
+            "user": existing_users,
+        }
+        indexes = {
+            "role": ("roles", (database_id,)),
+            "configured_role": ("configured_roles", (database_id, None)),
+            "user": ("users", None),
+        }
+
+        def add_chunk(chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            reports = []
+            calls = []
+            targets = []
+            scheduled = set()
+            for user in chunk:
+                report = {
+                    "username": user.get("username"),
+                    "status": "existing",
+                    "created": [],
+                    "collaborator": None,
+                    "error": None,
+                }
+                try:
+                    username = user["username"]
+                    rolename = user.get("rolename") or username
+                    role_password = user.get("role_password") or user["password"]
+                    user_def = UserDef(**{
+                        k: v
+                        for k, v in (
+                            ("username", username),
+                            ("password", user["password"]),
+                            ("is_superuser", user.get("is_superuser", False)),
+                            ("email", user.get("email")),
+                            ("full_name", user.get("full_name")),
+                            ("display_language", user.get("display_language")),
+                        )
+                        if v is not None
+                    })
+                except (KeyError, TypeError) as exc:
+                    report["error"] = exc
+                    reports.append((report, None))
+                    continue
+                reports.append((report, rolename))
+                missing = (
+                    ("role", rolename, partial(
+                        API.roles_add,
+                        self,
+                        rolename=rolename,
+                        database_id=database_id,
+                        password=role_password,
+                        login=True
+                    )),
+                    ("configured_role", rolename, partial(
+                        API.roles_configured_add,
+                        self,
+                        server_id=database_id,
+                        name=rolename,
+                        password=role_password
+                    )),
+                    ("user", username, partial(API.users_add, self, user_def=user_def)),
+                )
+                for kind, name, call in missing:
+                    if name not in found[kind] and (kind, name) not in scheduled:
+                        scheduled.add((kind, name))
+                        targets.append((kind, name))
+                        calls.append((report, call))
+            # Roles, configured roles and users
+            errors = {}
+            outcomes = self._send_batch([call for _, call in calls], max_size=len(calls) or 1, timeout=timeout)
+            for (kind, name), (report, _), outcome in zip(targets, calls, outcomes):
+                if isinstance(outcome, (IntegrityError, DuplicateObject)):
+                    # Added meanwhile, e.g. by another chunk
+                    continue
+                elif isinstance(outcome, Exception):
+                    errors[(kind, name)] = outcome
+                    continue
+                report["created"].append(kind)
+                found[kind][name] = outcome
+                index_kind, scopes = indexes[kind]
+                self._update_indexes(index_kind, scopes=scopes, add=outcome)
+            # Collaborators
+            calls = []
+            for report, rolename in reports:
+                if report["error"] is not None:
+                    continue
+                username = report["username"]
+                try:
+                    for key in (("role", rolename), ("configured_role", rolename), ("user", username)):
+                        if key in errors:
+                            raise errors[key]
+                    configured_role = configured_roles.get(rolename) or self.roles_configured_get(
+                        role_name=rolename,
+                        server_id=database_id,
+                        timeout=timeout
+                    )
+                    user_info = existing_users.get(username) or self.users_get(username=username, timeout=timeout)
+                except Exception as exc:
+                    report["error"] = exc
+                    continue
+                collaborator = collaborators.get(user_info["id"])
+                if collaborator is not None:
+                    report["collaborator"] = collaborator
+                    continue
+                calls.append((report, user_info["id"], partial(
+                    API.collaborators_add,
+                    self,
+                    database_id=database_id,
+                    user_id=user_info["id"],
+                    configured_role_id=configured_role["id"]
+                )))
+            outcomes = self._send_batch([call for _, _, call in calls], max_size=len(calls) or 1, timeout=timeout)
+            for (report, user_id, _), outcome in zip(calls, outcomes):
+                if isinstance(outcome, IntegrityError):
+                    try:
+                        outcome = self.collaborators_get(user_id=user_id, database_id=database_id, timeout=timeout)
+                    except Exception as exc:
+                        outcome = exc
+                elif not isinstance(outcome, Exception):
+                    report["created"].append("collaborator")
+                    collaborators[user_id] = outcome
+                    self._update_indexes("collaborators", scopes=(database_id, None), add=outcome)
+                if isinstance(outcome, Exception):
+                    report["error"] = outcome
+                else:
+                    report["collaborator"] = outcome
+            for report, _ in reports:
+                if report["error"] is not None:
+                    report["status"] = "failed"
+                elif report["created"]:
+                    report["status"] = "created"
+            return [report for report, _ in reports]
+
+        return _map_chunks(add_chunk, users, chunk_size, workers)
 
     def collaborators_full_delete(
             self, /,
@@ -208,49 +1316,21 @@ class Mathesar(API):
             database_id: int,
             rolename: str = None,
             missing_ok: bool = True,
+            timeout: Timeout = None,
             **kwargs
     ):
-        rolename = rolename or username
-        self.collaborators_delete(
-            username=username,
-            database_id=database_id,
-            missing_ok=missing_ok
-        )
-        self.users_delete(
-            username=username,
-            missing_ok=missing_ok
-        )
-        self.roles_configured_delete(
-            rolename=rolename,
-            server_id=database_id,
-            missing_ok=missing_ok
-        )
-        self.roles_delete(
-            database_id=database_id,
-            rolename=rolename,
-            missing_ok=missing_ok
-        )
+        return run(self._collaborators_full_delete(username, database_id, rolename, missing_ok, timeout))
 
     def collaborators_get_id(
             self, /,
             collaborator_id: int = None,
             user_id: int = None,
             username: str = None,
+            database_id: int = None,
+            timeout: Timeout = None,
             **kwargs
     ):
-        if user_id is not None or username is not None:
-            user_id = self.users_get(user_id=user_id, username=username)
-            for info in self.collaborators_list():
-                if info["user_id"] == user_id:
-                    if collaborator_id is None or collaborator_id == info["id"]:
-                        return info["id"]
-                    else:
-                        raise ValueError(f"Collaborator ID of {username} is not {collaborator_id}")
-            raise DoesNotExist("Collaborator matching query does not exist.")
-        elif collaborator_id is not None:
-            return collaborator_id
-        else:
-            raise TypeError("Missing either collaborator_id or user_id or username")
+        return run(self._collaborators_get_id(collaborator_id, user_id, username, database_id, timeout))
 
     def collaborators_get(
             self, /,
@@ -258,22 +1338,10 @@ class Mathesar(API):
             user_id: int = None,
             username: str = None,
             database_id: int = None,
+            timeout: Timeout = None,
             **kwargs
     ) -> CollaboratorInfo:
-        if username is not None:
-            user_id = self.users_get_id(user_id=user_id, username=username)
-        for info in self.collaborators_list(database_id=database_id):
-            if user_id is not None and user_id == info["user_id"]:
-                if collaborator_id is None or collaborator_id == info["id"]:
-                    return info
-                else:
-                    raise ValueError(f"Collaborator ID of {username or user_id} is not {collaborator_id}")
-            elif info["id"] == collaborator_id:
-                return info
-        if collaborator_id is not None or user_id is not None:
-            raise DoesNotExist("Collaborator matching query does not exist.")
-        else:
-            raise TypeError("Missing either collaborator_id or user_id or username")
+        return run(self._collaborators_get(collaborator_id, user_id, username, database_id, timeout))
 
     def collaborators_add(
             self, /,
@@ -283,32 +1351,18 @@ class Mathesar(API):
             configured_role_id: int = None,
             rolename: str = None,
             exists_ok: bool = False,
+            timeout: Timeout = None,
             **kwargs
     ) -> CollaboratorInfo:
-        user_id = self.users_get_id(
-            user_id=user_id,
-            username=username
-        )
-        configured_role_id = self.roles_configured_get_id(
-            configured_role_id=configured_role_id,
-            rolename=rolename,
-            server_id=database_id
-        )
-        try:
-            return super().collaborators_add(
-                database_id=database_id,
-                user_id=user_id,
-                configured_role_id=configured_role_id
-            )
-        except IntegrityError:
-            if exists_ok:
-                return self.collaborators_get(
-                    username=username,
-                    user_id=user_id,
-                    database_id=database_id
-                )
-            else:
-                raise
+        return run(self._collaborators_add(
+            database_id,
+            user_id,
+            username,
+            configured_role_id,
+            rolename,
+            exists_ok,
+            timeout
+        ))
 
     def collaborators_delete(
             self, /,
@@ -316,60 +1370,30 @@ class Mathesar(API):
             username: str = None,
             database_id: int = None,
             missing_ok: bool = False,
+            timeout: Timeout = None,
             **kwargs
     ):
-        try:
-            collaborator_id = self.collaborators_get_id(
-                collaborator_id=collaborator_id,
-                username=username,
-                database_id=database_id
-            )
-            super().collaborators_delete(collaborator_id=collaborator_id)
-        except DoesNotExist:
-            if not missing_ok:
-                raise
+        return run(self._collaborators_delete(collaborator_id, username, database_id, missing_ok, timeout))
 
     def roles_configured_get_id(
             self, /,
             configured_role_id: int = None,
             rolename: str = None,
             server_id: int = None,
+            timeout: Timeout = None,
             **kwargs
     ):
-        if rolename is not None:
-            for info in self.roles_configured_list(server_id=server_id):
-                if info["name"] == rolename:
-                    if configured_role_id is None or configured_role_id == info["id"]:
-                        return info["id"]
-                    else:
-                        raise ValueError(f"Configured role ID of {rolename} is not {configured_role_id}")
-            raise DoesNotExist(f"Configured Role matching query does not exist.")
-        elif configured_role_id is not None:
-            return configured_role_id
-        else:
-            raise TypeError("Missing either configured_role_id or configured_role_name")
+        return run(self._roles_configured_get_id(configured_role_id, rolename, server_id, timeout))
 
     def roles_configured_get(
             self, /,
             configured_role_id: int = None,
             role_name: str = None,
             server_id: int = None,
+            timeout: Timeout = None,
             **kwargs
     ):
-        for info in self.roles_configured_list(server_id=server_id):
-            if info["name"] == role_name:
-                if configured_role_id is None or configured_role_id == info["id"]:
-                    return info
-                else:
-                    raise ValueError(f"Configured role ID of {role_name} is not {configured_role_id}")
-            elif info["id"] == configured_role_id:
-                return info
-        if role_name is not None:
-            raise UndefinedObject(f"Configured role with name {role_name} does not exist")
-        elif configured_role_id is not None:
-            raise UndefinedObject(f"Configured role with OID {configured_role_id} does not exist")
-        else:
-            raise TypeError("Missing either configured_role_id or role_name")
+        return run(self._roles_configured_get(configured_role_id, role_name, server_id, timeout))
 
     def roles_configured_add(
             self, /,
@@ -377,19 +1401,10 @@ class Mathesar(API):
             name: str,
             password: str,
             exists_ok: bool = False,
+            timeout: Timeout = None,
             **kwargs
     ) -> ConfiguredRoleInfo:
-        try:
-            return super().roles_configured_add(
-                server_id=server_id,
-                name=name,
-                password=password
-            )
-        except IntegrityError:
-            if exists_ok:
-                return self.roles_configured_get(role_name=name, server_id=server_id)
-            else:
-                raise
+        return run(self._roles_configured_add(server_id, name, password, exists_ok, timeout))
 
     def roles_configured_delete(
             self, /,
@@ -397,52 +1412,30 @@ class Mathesar(API):
             rolename: str = None,
             server_id: int = None,
             missing_ok: bool = False,
+            timeout: Timeout = None,
             **kwargs
     ):
-        try:
-            configured_role_id = self.roles_configured_get_id(
-                configured_role_id=configured_role_id,
-                rolename=rolename,
-                server_id=server_id
-            )
-            super().roles_configured_delete(configured_role_id=configured_role_id)
-        except DoesNotExist:
-            if not missing_ok:
-                raise
-
-    def roles_get_oid(self, /, role_oid: int = None, rolename: str = None, database_id: int = None, **kwargs):
-        if rolename is not None:
-            for info in self.roles_list(database_id=database_id):
-                if info["name"] == rolename:
-                    if role_oid is None or role_oid == info["oid"]:
-                        return info["oid"]
-                    else:
-                        raise ValueError(f"Role OID of {rolename} is not {role_oid}")
-            raise UndefinedObject(f"Role with name {rolename} does not exist")
-        elif role_oid is not None:
-            return role_oid
-        else:
-            raise TypeError("Missing either role_oid or role_name")
-
-    def roles_get(self, /, database_id: int, role_oid: int = None, rolename: str = None, **kwargs):
-        for info in self.roles_list(database_id=database_id):
-            found = None
-            if info["name"] == rolename:
-                if role_oid is None or role_oid == info["oid"]:
-                    found = info
-                else:
-                    raise ValueError(f"Role OID of {rolename} is not {role_oid}")
-            elif info["oid"] == role_oid:
-                found = info
-            if found is not None:
-                found["members"] = found["members"] or []
-                return found
-        if rolename is not None:
-            raise UndefinedObject(f"Role with name {rolename} does not exist")
-        elif role_oid is not None:
-            raise UndefinedObject(f"Role with OID {role_oid} does not exist")
-        else:
-            raise TypeError("Missing either role_oid or role_name")
+        return run(self._roles_configured_delete(configured_role_id, rolename, server_id, missing_ok, timeout))
+
+    def roles_get_oid(
+            self, /,
+            role_oid: int = None,
+            rolename: str = None,
+            database_id: int = None,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return run(self._roles_get_oid(role_oid, rolename, database_id, timeout))
+
+    def roles_get(
+            self, /,
+            database_id: int,
+            role_oid: int = None,
+            rolename: str = None,
+            timeout: Timeout = None,
+            **kwargs
+    ):
+        return run(self._roles_get(database_id, role_oid, rolename, timeout))
 
     def roles_add(
             self, /,
@@ -451,20 +1444,10 @@ class Mathesar(API):
             password: str = None,
             login: bool = None,
             exists_ok: bool = False,
+            timeout: Timeout = None,
             **kwargs
     ) -> RoleInfo:
-        try:
-            return super().roles_add(
-                rolename=rolename,
-                database_id=database_id,
-                password=password,
-                login=login
-            )
-        except DuplicateObject:
-            if exists_ok:
-                return self.roles_get(database_id=database_id, rolename=rolename)
-            else:
-                raise
+        return run(self._roles_add(rolename, database_id, password, login, exists_ok, timeout))
 
     def roles_delete(
             self, /,
@@ -472,14 +1455,10 @@ class Mathesar(API):
             role_oid: int = None,
             rolename: str = None,
             missing_ok: bool = False,
+            timeout: Timeout = None,
             **kwargs
     ):
-        try:
-            role_oid = self.roles_get_oid(database_id=database_id, role_oid=role_oid, rolename=rolename)
-            super().roles_delete(database_id=database_id, role_oid=role_oid)
-        except UndefinedObject:
-            if not missing_ok:
-                raise
+        return run(self._roles_delete(database_id, role_oid, rolename, missing_ok, timeout))
 
     def roles_append_member(
             self, /,
@@ -488,21 +1467,14 @@ class Mathesar(API):
             parent_role_oid: int = None,
             rolename: str = None,
             role_oid: str = None,
+            timeout: Timeout = None,
             **kwargs
     ):
-        role_oid = self.roles_get_oid(
-            role_oid=role_oid,
-            rolename=rolename,
-            database_id=database_id
-        )
-        parent_info = self.roles_get(
-            database_id=database_id,
-            rolename=parent_rolename,
-            role_oid=parent_role_oid
-        )
-        members = [item["oid"] for item in parent_info["members"]]
-        super().roles_set_members(
-            parent_role_oid=parent_info["oid"],
-            members=[*members, role_oid],
-            database_id=database_id
-        )
+        return run(self._roles_append_member(
+            database_id,
+            parent_rolename,
+            parent_role_oid,
+            rolename,
+            role_oid,
+            timeout
+        ))
@@ -0,0 +1,130 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable
+
+from .batch import resolve
+from .deadlines import Timeout
+
+
+class Index:
+    """
+    A list fetched from the server, indexed by id and by name.
+
+    The list is fetched on first use and again once `ttl` seconds have
+    passed (on every use with a TTL of 0, never with None) or after
+    `invalidate`. `add` and `remove` update a loaded list in place.
+
+    The list is fetched outside of the lock guarding the indexes, by one
+    thread at a time, and swapped in whole, so lookups never see a list
+    being loaded. `load` and `refresh` pass their `timeout` on to `fetch`.
+    """
+
+    def __init__(self, fetch: Callable[[], list[dict]], id_key: str, name_key: str, ttl: float = None):
+        self._fetch = fetch
+        self._id_key = id_key
+        self._name_key = name_key
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._loaded_at: float = None
+        # Bumped by every change, so that a fetch overlapping one is not trusted
+        self._version = 0
+        self._by_id: dict[Hashable, dict] = {}
+        self._by_name: dict[Hashable, dict] = {}
+
+    def _fresh(self) -> bool:
+        return self._loaded_at is not None and (
+                self._ttl is None or time.monotonic() - self._loaded_at < self._ttl
+        )
+
+    def load(self, timeout: Timeout = None) -> tuple[dict[Hashable, dict], dict[Hashable, dict]]:
+        with self._lock:
+            if self._fresh():
+                return self._by_id, self._by_name
+        with self._refresh_lock:
+            with self._lock:
+                # Refreshed by another thread meanwhile
+                if self._fresh():
+                    return self._by_id, self._by_name
+            return self.refresh(timeout)
+
+    def refresh(self, timeout: Timeout = None) -> tuple[dict[Hashable, dict], dict[Hashable, dict]]:
+        with self._lock:
+            version = self._version
+        by_id = {}
+        by_name = {}
+        for info in resolve(self._fetch() if timeout is None else self._fetch(timeout=timeout)):
+            # The first item wins, as with a linear scan
+            by_id.setdefault(info[self._id_key], info)
+            by_name.setdefault(info[self._name_key], info)
+        with self._lock:
+            self._by_id = by_id
+            self._by_name = by_name
+            # A change made while fetching may be missing, fetch again on next use
+            self._loaded_at = time.monotonic() if version == self._version else None
+        return by_id, by_name
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded_at = None
+            self._version += 1
+
+    def by_id(self, value: Hashable) -> dict | None:
+        by_id, _ = self.load()
+        return by_id.get(value)
+
+    def by_name(self, value: Hashable) -> dict | None:
+        _, by_name = self.load()
+        return by_name.get(value)
+
+    def values(self) -> list[dict]:
+        by_id, _ = self.load()
+        return list(by_id.values())
+
+    def add(self, info: Any):
+        with self._lock:
+            self._version += 1
+            if self._loaded_at is None:
+                return
+            if isinstance(info, Future):
+                # Not resolved yet, refetch the list on next use
+                self._loaded_at = None
+            else:
+                # The first item wins, as with a linear scan
+                self._by_id.setdefault(info[self._id_key], info)
+                self._by_name.setdefault(info[self._name_key], info)
+
+    def remove(self, value: Hashable):
+        with self._lock:
+            self._version += 1
+            info = self._by_id.pop(value, None)
+            if info is not None and self._by_name.get(info[self._name_key]) is info:
+                del self._by_name[info[self._name_key]]
+
+
+class Scan:
+    """
+    A list fetched from the server, searched item by item by id and by
+    name, with the lookup methods of `Index`.
+    """
+
+    def __init__(self, items: list[dict], id_key: str, name_key: str):
+        self._items = items
+        self._id_key = id_key
+        self._name_key = name_key
+
+    def _find(self, key: str, value: Hashable) -> dict | None:
+        for info in self._items:
+            if info[key] == value:
+                return info
+        return None
+
+    def by_id(self, value: Hashable) -> dict | None:
+        return self._find(self._id_key, value)
+
+    def by_name(self, value: Hashable) -> dict | None:
+        return self._find(self._name_key, value)
+
+    def values(self) -> list[dict]:
+        return list(self._items)
@@ -0,0 +1,116 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Iterable
+
+# Actions that only read, or set a state regardless of the current one
+_idempotent_actions = {"list", "get", "search", "run", "run_saved", "suggest_types", "patch", "set", "replace"}
+_idempotent_prefixes = ("list_", "get_", "patch_", "set_", "replace_")
+
+
+def is_idempotent(method: str) -> bool:
+    """
+    Whether the JSON-RPC `method` can be sent again without changing the
+    outcome, e.g. `records.list` or `records.patch` but not `records.add`.
+    """
+    action = method.rsplit(".", 1)[-1]
+    return action in _idempotent_actions or action.startswith(_idempotent_prefixes)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before sending a failed request again.
+
+    A request is resent up to `attempts` times on connection errors,
+    timeouts and the HTTP `statuses`, waiting a random time up to
+    `backoff * 2 ** attempt` seconds, capped at `max_backoff`, or the
+    `Retry-After` of the response when there is one. Requests which may
+    have reached the server are only resent when all their methods are
+    `idempotent`, requests which failed to connect or were answered with
+    429 always are.
+
+    Each client allows on average `budget_ratio` retries per request, with
+    bursts of up to `budget_burst`, so that retries cannot multiply the
+    load on a failing server.
+    """
+
+    def __init__(
+            self,
+            attempts: int = 3,
+            backoff: float = 0.5,
+            max_backoff: float = 30.0,
+            statuses: Iterable[int] = (429, 502, 503, 504),
+            budget_ratio: float = 0.2,
+            budget_burst: float = 10.0,
+            idempotent: Callable[[str], bool] = is_idempotent
+    ):
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.budget_ratio = budget_ratio
+        self.budget_burst = budget_burst
+        self.idempotent = idempotent
+
+    def delay(
+            self,
+            methods: list[str],
+            attempt: int,
+            sent: bool = True,
+            status: int = None,
+            retry_after: float = None
+    ) -> float | None:
+        """
+        Seconds to wait before attempt number `attempt + 1`, or None if the
+        request should not be sent again.
+        """
+        if attempt >= self.attempts:
+            return None
+        if status is not None:
+            if status not in self.statuses:
+                return None
+            sent = status != 429
+        if sent and not all(self.idempotent(method) for method in methods):
+            return None
+        if retry_after is not None:
+            # Waiting longer than max_backoff is left to the caller
+            return retry_after if retry_after <= self.max_backoff else None
+        return random.uniform(0, min(self.backoff * 2 ** attempt, self.max_backoff))
+
+
+class RetryBudget:
+    """
+    A token bucket refilled by `ratio` tokens per request, up to `burst`,
+    from which every retry takes one.
+    """
+
+    def __init__(self, ratio: float, burst: float):
+        self._ratio = ratio
+        self._burst = burst
+        self._tokens = burst
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self._tokens + self._ratio, self._burst)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
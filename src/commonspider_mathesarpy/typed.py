@@ -0,0 +1,94 @@
+import dataclasses
+import typing
+from functools import lru_cache
+from typing import Any
+
+struct = dataclasses.dataclass(slots=True, kw_only=True)
+
+
+class Struct:
+    __slots__ = ()
+
+    # Mapping-style access keeps code written against the TypedDicts working
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any):
+        setattr(self, key, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(dataclasses.fields(self))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def keys(self):
+        return [field.name for field in dataclasses.fields(self)]
+
+    def values(self):
+        return [getattr(self, key) for key in self.keys()]
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.keys()]
+
+    def to_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@lru_cache(maxsize=None)
+def _fields(cls: type) -> tuple[tuple[str, Any], ...]:
+    hints = typing.get_type_hints(cls)
+    return tuple((field.name, hints[field.name]) for field in dataclasses.fields(cls))
+
+
+@lru_cache(maxsize=None)
+def struct_annotation(annotation: Any) -> Any:
+    """
+    Map an annotation using the TypedDicts of `classes` to the equivalent
+    generated structs.
+    """
+    from . import structs
+
+    if typing.is_typeddict(annotation):
+        return getattr(structs, annotation.__name__, dict)
+    origin = typing.get_origin(annotation)
+    if origin is list:
+        return list[struct_annotation(typing.get_args(annotation)[0])]
+    elif origin is dict:
+        key, value = typing.get_args(annotation)
+        return dict[key, struct_annotation(value)]
+    return annotation
+
+
+def convert(value: Any, annotation: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(annotation, type) and issubclass(annotation, Struct):
+        if not isinstance(value, dict):
+            return value
+        return annotation(**{
+            name: convert(value.get(name), hint)
+            for name, hint in _fields(annotation)
+        })
+    origin = typing.get_origin(annotation)
+    if origin is list and isinstance(value, list):
+        item = typing.get_args(annotation)[0]
+        return [convert(v, item) for v in value]
+    elif origin is dict and isinstance(value, dict):
+        item = typing.get_args(annotation)[1]
+        return {k: convert(v, item) for k, v in value.items()}
+    elif origin is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return convert(value, args[0])
+    return value
+
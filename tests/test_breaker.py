@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+from commonspider_mathesarpy.breaker import Circuit, Circuits, acquire_all, release_all
+from commonspider_mathesarpy.exceptions import CircuitOpen
+
+
+def fail(circuit: Circuit, times: int):
+    for _ in range(times):
+        probe = circuit.acquire()
+        circuit.release(probe, True)
+
+
+def test_opens_after_threshold_failures():
+    circuit = Circuit("test", threshold=3, reset_timeout=60, probes=1)
+    fail(circuit, 2)
+    assert circuit.state == "closed"
+    fail(circuit, 1)
+    assert circuit.state == "open"
+    with pytest.raises(CircuitOpen) as info:
+        circuit.acquire()
+    assert 0 < info.value.retry_after <= 60
+
+
+def test_success_resets_failures():
+    circuit = Circuit("test", threshold=2, reset_timeout=60, probes=1)
+    fail(circuit, 1)
+    circuit.release(circuit.acquire(), False)
+    fail(circuit, 1)
+    assert circuit.state == "closed"
+
+
+def test_half_open_lets_one_probe_through():
+    circuit = Circuit("test", threshold=1, reset_timeout=0.01, probes=1)
+    fail(circuit, 1)
+    time.sleep(0.02)
+    assert circuit.state == "half-open"
+    assert circuit.acquire() is True
+    with pytest.raises(CircuitOpen):
+        circuit.acquire()
+    circuit.release(True, False)
+    assert circuit.state == "closed"
+
+
+def test_failed_probe_reopens():
+    circuit = Circuit("test", threshold=5, reset_timeout=0.01, probes=1)
+    fail(circuit, 5)
+    time.sleep(0.02)
+    circuit.release(circuit.acquire(), True)
+    assert circuit.state == "open"
+
+
+def test_interrupted_probe_frees_its_slot():
+    circuit = Circuit("test", threshold=1, reset_timeout=0.01, probes=1)
+    fail(circuit, 1)
+    time.sleep(0.02)
+    circuit.release(circuit.acquire(), None)
+    assert circuit.state == "half-open"
+    assert circuit.acquire() is True
+
+
+def test_threads_send_one_probe_at_a_time():
+    circuit = Circuit("test", threshold=1, reset_timeout=0.01, probes=1)
+    fail(circuit, 1)
+    time.sleep(0.02)
+    barrier = threading.Barrier(8)
+    probes = []
+
+    def work():
+        barrier.wait()
+        try:
+            probes.append(circuit.acquire())
+        except CircuitOpen:
+            pass
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert probes == [True]
+
+
+def test_circuits_are_keyed_by_url_and_namespace():
+    circuits = Circuits()
+    assert circuits.get("a", "records.list") is circuits.get("a", "records.add")
+    assert circuits.get("a", "records.list") is not circuits.get("a", "tables.list")
+    assert circuits.get("a", "records.list") is not circuits.get("b", "records.list")
+
+
+def test_acquire_all_releases_acquired_probes_when_one_is_open():
+    half_open = Circuit("half-open", threshold=1, reset_timeout=0.01, probes=1)
+    fail(half_open, 1)
+    time.sleep(0.02)
+    closed = Circuit("open", threshold=1, reset_timeout=60, probes=1)
+    fail(closed, 1)
+    with pytest.raises(CircuitOpen):
+        acquire_all([half_open, closed])
+    probes = acquire_all([half_open])
+    assert probes == [True]
+    release_all([half_open], probes, False)
+    assert half_open.state == "closed"
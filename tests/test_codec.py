@@ -0,0 +1,42 @@
+import dataclasses
+
+import pytest
+
+from commonspider_mathesarpy.codec import JSONCodec, MsgspecCodec, OrjsonCodec, msgspec, orjson
+
+codecs = [
+    JSONCodec,
+    pytest.param(OrjsonCodec, marks=pytest.mark.skipif(orjson is None, reason="orjson is not installed")),
+    pytest.param(MsgspecCodec, marks=pytest.mark.skipif(msgspec is None, reason="msgspec is not installed")),
+]
+
+
+@pytest.mark.parametrize("codec", codecs)
+def test_round_trip(codec):
+    value = {"result": {"results": [{"1": 1, "2": "name", "3": 1.5, "4": None, "5": [True]}]}}
+    assert codec().decode(codec().encode(value)) == value
+
+
+@pytest.mark.parametrize("codec", codecs)
+@pytest.mark.parametrize("number", [123456789012345678901234567890, -2 ** 64, 2 ** 63])
+def test_integers_beyond_64_bits_are_exact(codec, number):
+    value = {"result": [number, str(number)]}
+    data = codec().encode(value)
+    assert str(number).encode() in data
+    assert codec().decode(data) == value
+    assert codec().decode(b'{"result": %d}' % number)["result"] == number
+
+
+@pytest.mark.parametrize("codec", codecs)
+def test_invalid_json_raises(codec):
+    with pytest.raises(Exception):
+        codec().decode(b"<html>Bad Gateway</html>")
+
+
+def test_json_encodes_dataclasses():
+    @dataclasses.dataclass
+    class Point:
+        x: int
+        y: int
+
+    assert JSONCodec().encode({"point": Point(1, 2)}) == b'{"point":{"x":1,"y":2}}'
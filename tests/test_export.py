@@ -0,0 +1,36 @@
+import gc
+import gzip
+import io
+
+import pytest
+
+from commonspider_mathesarpy.codec import JSONCodec
+from commonspider_mathesarpy.export import write_rows
+
+pages = [[{"id": 1, "tags": ["a"]}], [{"id": 2, "tags": None}]]
+
+
+def test_csv():
+    buffer = io.BytesIO()
+    assert write_rows(buffer, pages, {"ID": "id", "Tags": "tags"}, codec=JSONCodec()) == 2
+    assert buffer.getvalue() == b'ID,Tags\r\n1,"[""a""]"\r\n2,\r\n'
+    assert not buffer.closed
+
+
+def test_compressed_jsonl():
+    buffer = io.BytesIO()
+    write_rows(buffer, pages, {"ID": "id"}, format="jsonl", compress=True, codec=JSONCodec())
+    assert gzip.decompress(buffer.getvalue()) == b'{"ID":1}\n{"ID":2}\n'
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_failed_export_leaves_stream_open(compress):
+    def failing_pages():
+        yield pages[0]
+        raise RuntimeError("page failed")
+
+    buffer = io.BytesIO()
+    with pytest.raises(RuntimeError):
+        write_rows(buffer, failing_pages(), {"ID": "id"}, compress=compress)
+    gc.collect()
+    assert not buffer.closed
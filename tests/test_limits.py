@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+
+from commonspider_mathesarpy.limits import Limiter
+
+
+def test_failure_decreases_concurrency_once_per_cooldown():
+    limiter = Limiter(concurrency=8, cooldown=60)
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(0.0, failed=True)
+    assert limiter.concurrency == 4
+
+
+def test_concurrency_stays_above_minimum():
+    limiter = Limiter(concurrency=4, min_concurrency=3, cooldown=0)
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release(0.0, failed=True)
+    assert limiter.concurrency == 3
+
+
+def test_slow_requests_decrease_concurrency():
+    limiter = Limiter(concurrency=8, latency_target=0.5)
+    limiter.acquire()
+    limiter.release(1.0)
+    assert limiter.concurrency == 4
+
+
+def test_successes_grow_concurrency_up_to_maximum():
+    limiter = Limiter(concurrency=2, max_concurrency=4, cooldown=0)
+    limiter.acquire()
+    limiter.release(0.0, failed=True)
+    assert limiter.concurrency == 1
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(0.0)
+    # Grows by one per limit's worth of successes: 1 -> 2 -> 2.5 -> 2.9
+    assert limiter.concurrency == 2
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release(0.0)
+    assert limiter.concurrency == 4
+
+
+def test_rate_delays_calls_beyond_burst():
+    limiter = Limiter(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+
+
+def test_threads_never_exceed_concurrency():
+    limiter = Limiter(concurrency=2)
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def work():
+        nonlocal in_flight, peak
+        for _ in range(20):
+            limiter.acquire()
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.001)
+            with lock:
+                in_flight -= 1
+            limiter.release(0.0)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == 2
+
+
+def test_async_waiters_are_woken_in_order():
+    async def main():
+        limiter = Limiter(concurrency=1)
+        await limiter.acquire_async()
+        order = []
+
+        async def wait(name):
+            await limiter.acquire_async()
+            order.append(name)
+            limiter.release(0.0)
+
+        tasks = [asyncio.create_task(wait(name)) for name in "abc"]
+        await asyncio.sleep(0)
+        limiter.release(0.0)
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+        return order
+
+    assert asyncio.run(main()) == ["a", "b", "c"]
+
+
+def test_cancelled_async_waiter_passes_its_wakeup_on():
+    async def main():
+        limiter = Limiter(concurrency=1)
+        await limiter.acquire_async()
+        first = asyncio.create_task(limiter.acquire_async())
+        second = asyncio.create_task(limiter.acquire_async())
+        await asyncio.sleep(0)
+        # The wakeup goes to the first waiter, which is cancelled before it runs
+        limiter.release(0.0)
+        first.cancel()
+        await asyncio.wait_for(second, 1)
+        return first.cancelled()
+
+    assert asyncio.run(main())
+
+
+def test_threads_and_event_loop_share_a_limiter():
+    limiter = Limiter(concurrency=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def run_loop():
+        async def main():
+            await limiter.acquire_async()
+            acquired.set()
+            limiter.release(0.0)
+
+        asyncio.run(main())
+
+    thread = threading.Thread(target=run_loop)
+    thread.start()
+    time.sleep(0.05)
+    assert not acquired.is_set()
+    limiter.release(0.0)
+    thread.join(1)
+    assert acquired.is_set()
+
+
+def test_acquire_gives_up_on_rate_beyond_timeout():
+    limiter = Limiter(rate=1, burst=1)
+    assert limiter.acquire()
+    start = time.monotonic()
+    assert not limiter.acquire(timeout=0.1)
+    assert time.monotonic() - start < 0.1
+    # The tokens were left for later calls
+    assert limiter.acquire(timeout=1.1)
+
+
+def test_acquire_gives_up_on_concurrency_after_timeout():
+    limiter = Limiter(concurrency=1)
+    limiter.acquire()
+    start = time.monotonic()
+    assert not limiter.acquire(timeout=0.05)
+    assert time.monotonic() - start >= 0.05
+    limiter.release(0.0)
+    assert limiter.acquire(timeout=0.05)
+
+
+def test_async_acquire_gives_up_after_timeout():
+    async def main():
+        limiter = Limiter(concurrency=1)
+        await limiter.acquire_async()
+        late = await limiter.acquire_async(timeout=0.05)
+        waiting = asyncio.create_task(limiter.acquire_async(timeout=1))
+        await asyncio.sleep(0)
+        limiter.release(0.0)
+        return late, await waiting
+
+    assert asyncio.run(main()) == (False, True)
+
+
+def test_release_of_unsent_request_keeps_concurrency():
+    limiter = Limiter(concurrency=4, cooldown=0)
+    limiter.acquire()
+    limiter.release(None)
+    assert limiter.concurrency == 4
@@ -0,0 +1,92 @@
+import sys
+import threading
+import time
+
+from commonspider_mathesarpy.metadata import Index, Scan
+
+items = [{"id": i, "name": f"n{i}"} for i in range(200)]
+
+
+def test_lookups_by_id_and_name():
+    index = Index(lambda: [*items, {"id": 0, "name": "n1"}], "id", "name")
+    assert index.by_id(5)["name"] == "n5"
+    # The first item wins, as with a linear scan
+    assert index.by_name("n1")["id"] == 1
+    assert index.by_name("missing") is None
+
+
+def test_fetches_once_until_invalidated():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return items
+
+    index = Index(fetch, "id", "name")
+    index.by_id(1)
+    index.by_name("n2")
+    assert len(calls) == 1
+    index.invalidate()
+    index.by_id(1)
+    assert len(calls) == 2
+
+
+def test_add_and_remove_update_loaded_index():
+    index = Index(lambda: list(items), "id", "name")
+    index.by_id(0)
+    index.add({"id": 500, "name": "new"})
+    assert index.by_name("new")["id"] == 500
+    index.remove(500)
+    assert index.by_id(500) is None
+    assert index.by_name("new") is None
+
+
+def test_change_during_fetch_refetches():
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        if len(calls) == 1:
+            index.add({"id": 500, "name": "new"})
+            return list(items)
+        return [*items, {"id": 500, "name": "new"}]
+
+    index = Index(fetch, "id", "name")
+    index.by_id(0)
+    assert index.by_name("new")["id"] == 500
+    assert len(calls) == 2
+
+
+def test_concurrent_lookups_never_miss():
+    interval = sys.getswitchinterval()
+
+    def fetch():
+        time.sleep(0.001)
+        return items
+
+    index = Index(fetch, "id", "name", ttl=0)
+    misses = []
+
+    def work():
+        for _ in range(100):
+            if index.by_name("n150") is None:
+                misses.append(1)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    # Switch threads often to expose a lookup racing a refresh
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert misses == []
+
+
+def test_scan():
+    scan = Scan([*items, {"id": 0, "name": "n1"}], "id", "name")
+    assert scan.by_id(0)["name"] == "n0"
+    assert scan.by_name("n1")["id"] == 1
+    assert scan.by_name("missing") is None
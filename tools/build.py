@@ -204,3 +204,37 @@ with open(output_path / "classes.py", "w") as f:
     parse_class(p)
     for _, p in parsed_classes.items()
 ]))
+
+
+def parse_struct(cls):
+    fields = []
+    for param in cls["params"]:
+        param_type = param["type"]
+        if param_type.startswith("NotRequired["):
+            param_type = param_type.removeprefix("NotRequired[").removesuffix("]")
+            fields.append(f"    {param["name"]}: Optional[{param_type}] = None")
+        else:
+            fields.append(f"    {param["name"]}: {param_type}")
+    return (
+            "@struct\n" +
+            f"class {cls["name"]}(Struct):\n" +
+            '    """' +
+            tab(cls["doc"]) +
+            '\n    """\n\n' +
+            "\n".join(fields) + "\n"
+    )
+
+
+with open(output_path / "structs.py", "w") as f:
+    f.write(
+        """from __future__ import annotations
+
+from typing import Union, Any, Optional, Literal
+
+from .typed import Struct, struct
+
+
+""" + "\n\n".join([
+    parse_struct(p)
+    for _, p in parsed_classes.items()
+]))